@@ -0,0 +1,62 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import List, Sequence, Tuple
+
+
+def measure_import(path: str, heavy_modules: Sequence[str]) -> Tuple[float, List[str]]:
+    directory, filename = os.path.split(os.path.abspath(path))
+    module = os.path.splitext(filename)[0]
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "print((time.perf_counter() - start) * 1000)\n"
+        f"print(','.join(m for m in {tuple(heavy_modules)!r} if m in sys.modules))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=directory,
+        capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    loaded = [m for m in output[1].split(",") if m] if len(output) > 1 else []
+    return float(output[0]), loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Контроль времени импорта модуля без тяжёлых зависимостей")
+    parser.add_argument("path", help="путь к модулю, например kt2/dependency_analyzer.py")
+    parser.add_argument("--heavy", nargs="+", default=[],
+                        help="модули, которые не должны загружаться при импорте")
+    parser.add_argument("--max-ms", type=float, default=50.0, help="допустимая медиана времени импорта")
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+    
+    module = os.path.splitext(os.path.basename(args.path))[0]
+    timings = []
+    loaded_heavy = set()
+    for _ in range(args.runs):
+        elapsed, loaded = measure_import(args.path, args.heavy)
+        timings.append(elapsed)
+        loaded_heavy.update(loaded)
+    
+    median = statistics.median(timings)
+    print(f"Импорт {module}: медиана {median:.1f} мс, минимум {min(timings):.1f} мс ({args.runs} запусков)")
+    
+    failed = False
+    if loaded_heavy:
+        print(f"ОШИБКА: при импорте загружены тяжёлые модули: {sorted(loaded_heavy)}")
+        failed = True
+    if median > args.max_ms:
+        print(f"ОШИБКА: время импорта превышает {args.max_ms:.0f} мс")
+        failed = True
+    
+    if failed:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
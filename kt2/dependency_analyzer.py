@@ -1,14 +1,27 @@
 from collections import deque, defaultdict
-from typing import List, Set, Dict, Optional, Tuple
+from typing import Callable, List, Set, Dict, Optional, Tuple
+from html import escape
 
-try:
-    import networkx as nx
-    import matplotlib.pyplot as plt
-    VISUALIZATION_AVAILABLE = True
-except ImportError:
-    VISUALIZATION_AVAILABLE = False
-    nx = None
-    plt = None
+from importlib.util import find_spec
+
+VISUALIZATION_AVAILABLE = find_spec("networkx") is not None and find_spec("matplotlib") is not None
+
+
+def _load_visualization():
+    try:
+        import networkx as nx
+        import matplotlib.pyplot as plt
+    except ImportError:
+        raise ImportError(
+            "Для визуализации необходимо установить networkx и matplotlib.\n"
+            "Выполните: pip install networkx matplotlib"
+        ) from None
+    return nx, plt
+
+
+def _dot_escape(name: str) -> str:
+    return (name.replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\r\n', '\\n').replace('\n', '\\n').replace('\r', '\\n'))
 
 
 class DependencyGraph:
@@ -18,8 +31,13 @@ class DependencyGraph:
         self.graph: Dict[str, List[str]] = defaultdict(list)
         self.reverse_graph: Dict[str, List[str]] = defaultdict(list)
         self.weights: Dict[Tuple[str, str], float] = {}
+        self.version = 0
+        self._topo_cache: Optional[List[str]] = None
+        self._topo_cache_version = -1
     
     def add_component(self, name: str):
+        if name not in self.components:
+            self.version += 1
         self.components.add(name)
         if name not in self.graph:
             self.graph[name] = []
@@ -36,52 +54,54 @@ class DependencyGraph:
             self.reverse_graph[to_component].append(from_component)
         
         self.weights[(from_component, to_component)] = weight
+        self.version += 1
+    
+    def remove_dependency(self, from_component: str, to_component: str) -> bool:
+        if to_component not in self.graph.get(from_component, []):
+            return False
+        
+        self.graph[from_component].remove(to_component)
+        self.reverse_graph[to_component].remove(from_component)
+        self.weights.pop((from_component, to_component), None)
+        self.version += 1
+        return True
     
     def get_dependencies(self, component: str) -> List[str]:
         return self.graph.get(component, [])
     
-    def is_acyclic(self) -> bool:
+    def _kahn_order(self) -> List[str]:
+        if self._topo_cache_version == self.version:
+            return self._topo_cache
+        
         in_degree = {comp: 0 for comp in self.components}
         for from_comp in self.graph:
             for to_comp in self.graph[from_comp]:
                 in_degree[to_comp] += 1
         
         queue = deque([comp for comp in self.components if in_degree[comp] == 0])
-        processed = 0
+        result = []
         
         while queue:
             current = queue.popleft()
-            processed += 1
+            result.append(current)
             
             for neighbor in self.graph[current]:
                 in_degree[neighbor] -= 1
                 if in_degree[neighbor] == 0:
                     queue.append(neighbor)
         
-        return processed == len(self.components)
+        self._topo_cache = result
+        self._topo_cache_version = self.version
+        return result
+    
+    def is_acyclic(self) -> bool:
+        return len(self._kahn_order()) == len(self.components)
     
     def get_topological_order(self) -> Optional[List[str]]:
         if not self.is_acyclic():
             return None
         
-        in_degree = {comp: 0 for comp in self.components}
-        for from_comp in self.graph:
-            for to_comp in self.graph[from_comp]:
-                in_degree[to_comp] += 1
-        
-        queue = deque([comp for comp in self.components if in_degree[comp] == 0])
-        result = []
-        
-        while queue:
-            current = queue.popleft()
-            result.append(current)
-            
-            for neighbor in self.graph[current]:
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
-        
-        return result
+        return list(self._kahn_order())
     
     def get_weight(self, from_comp: str, to_comp: str) -> float:
         return self.weights.get((from_comp, to_comp), 1.0)
@@ -92,42 +112,77 @@ class DependencyAnalyzer:
     def __init__(self, graph: DependencyGraph):
         self.graph = graph
         self.dfs_cache: Dict[str, Set[str]] = {}
+        self.schedule_cache: Dict[str, Tuple[float, float, float]] = {}
+        self.longest_from: Dict[str, float] = {}
+        self.next_on_path: Dict[str, Optional[str]] = {}
+        self.project_duration = 0.0
+        self._schedule_version = -1
     
-    def find_dependencies_bfs(self, start: str) -> List[List[str]]:
+    def find_dependencies_bfs(self, start: str, max_depth: Optional[int] = None) -> List[List[str]]:
         if start not in self.graph.components:
             return []
         
-        visited = set()
+        visited = {start}
+        frontier = [start]
         result = []
-        queue = deque([(start, 0)])
-        level_map = defaultdict(list)
         
-        while queue:
-            current, level = queue.popleft()
+        while frontier and (max_depth is None or len(result) < max_depth):
+            next_frontier = []
             
-            if current in visited:
-                continue
+            for current in frontier:
+                for dep in self.graph.get_dependencies(current):
+                    if dep not in visited:
+                        visited.add(dep)
+                        next_frontier.append(dep)
+            
+            if not next_frontier:
+                break
+            
+            result.append(next_frontier)
+            frontier = next_frontier
+        
+        return result
+    
+    def find_dependencies_bfs_batch(self, starts: List[str],
+                                    max_depth: Optional[int] = None) -> Dict[str, List[List[str]]]:
+        sources = [comp for comp in dict.fromkeys(starts) if comp in self.graph.components]
+        result: Dict[str, List[List[str]]] = {comp: [] for comp in starts}
+        
+        seen: Dict[str, int] = defaultdict(int)
+        frontier: Dict[str, int] = {}
+        for i, comp in enumerate(sources):
+            seen[comp] |= 1 << i
+            frontier[comp] = frontier.get(comp, 0) | (1 << i)
+        
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            next_frontier: Dict[str, int] = defaultdict(int)
             
-            visited.add(current)
+            for current, mask in frontier.items():
+                for dep in self.graph.get_dependencies(current):
+                    new_bits = mask & ~seen[dep]
+                    if new_bits:
+                        seen[dep] |= new_bits
+                        next_frontier[dep] |= new_bits
             
-            dependencies = self.graph.get_dependencies(current)
+            if not next_frontier:
+                break
             
-            for dep in dependencies:
-                if dep not in visited:
-                    level_map[level + 1].append(dep)
-                    queue.append((dep, level + 1))
-        
-        if level_map:
-            max_level = max(level_map.keys())
-            for i in range(1, max_level + 1):
-                if i in level_map:
-                    unique_deps = []
-                    seen = set()
-                    for dep in level_map[i]:
-                        if dep not in seen:
-                            unique_deps.append(dep)
-                            seen.add(dep)
-                    result.append(unique_deps)
+            for comp in sources:
+                result[comp].append([])
+            
+            for dep, mask in next_frontier.items():
+                while mask:
+                    lowest = mask & -mask
+                    result[sources[lowest.bit_length() - 1]][depth].append(dep)
+                    mask ^= lowest
+            
+            frontier = next_frontier
+            depth += 1
+        
+        for comp in sources:
+            while result[comp] and not result[comp][-1]:
+                result[comp].pop()
         
         return result
     
@@ -138,91 +193,430 @@ class DependencyAnalyzer:
         if start in self.dfs_cache:
             return self.dfs_cache[start]
         
-        visited = set()
+        visited = {start}
         result = set()
+        stack = [start]
         
-        def dfs_recursive(component: str):
-            if component in visited:
-                return
-            
-            visited.add(component)
-            dependencies = self.graph.get_dependencies(component)
+        while stack:
+            component = stack.pop()
             
-            for dep in dependencies:
+            for dep in self.graph.get_dependencies(component):
                 result.add(dep)
-                dfs_recursive(dep)
-        
-        dfs_recursive(start)
+                if dep not in visited:
+                    visited.add(dep)
+                    stack.append(dep)
         
         self.dfs_cache[start] = result
         
         return result
     
-    def clear_cache(self):
-        self.dfs_cache.clear()
+    def find_dependents(self, component: str) -> Set[str]:
+        if component not in self.graph.components:
+            return set()
+        
+        visited = {component}
+        result = set()
+        stack = [component]
+        
+        while stack:
+            current = stack.pop()
+            
+            for dependent in self.graph.reverse_graph[current]:
+                result.add(dependent)
+                if dependent not in visited:
+                    visited.add(dependent)
+                    stack.append(dependent)
+        
+        return result
     
-    def find_critical_path(self, start: str) -> Tuple[List[str], float]:
-        if not self.graph.is_acyclic():
-            raise ValueError("Граф содержит циклы. Критический путь можно найти только в ациклическом графе.")
+    def add_dependency(self, from_component: str, to_component: str, weight: float = 1.0):
+        self.graph.add_dependency(from_component, to_component, weight)
         
-        if start not in self.graph.components:
-            return [], 0.0
+        affected = [closure for start, closure in self.dfs_cache.items()
+                    if start == from_component or from_component in closure]
+        if not affected:
+            return
         
-        topo_order = self.graph.get_topological_order()
-        if topo_order is None:
-            return [], 0.0
+        added = {to_component} | self.find_dependencies_dfs(to_component)
+        for closure in affected:
+            closure |= added
+    
+    def remove_dependency(self, from_component: str, to_component: str) -> bool:
+        if not self.graph.remove_dependency(from_component, to_component):
+            return False
+        
+        stale = [start for start, closure in self.dfs_cache.items()
+                 if start == from_component or from_component in closure]
+        for start in stale:
+            del self.dfs_cache[start]
+        return True
+    
+    def find_cycle(self) -> Optional[List[str]]:
+        WHITE, GRAY, BLACK = 0, 1, 2
+        color = {comp: WHITE for comp in self.graph.components}
+        parent: Dict[str, Optional[str]] = {}
         
-        try:
-            start_idx = topo_order.index(start)
-        except ValueError:
-            return [], 0.0
+        for root in self.graph.components:
+            if color[root] != WHITE:
+                continue
+            
+            color[root] = GRAY
+            parent[root] = None
+            stack = [(root, iter(self.graph.get_dependencies(root)))]
+            
+            while stack:
+                component, neighbors = stack[-1]
+                advanced = False
+                
+                for dep in neighbors:
+                    if color[dep] == WHITE:
+                        color[dep] = GRAY
+                        parent[dep] = component
+                        stack.append((dep, iter(self.graph.get_dependencies(dep))))
+                        advanced = True
+                        break
+                    
+                    if color[dep] == GRAY:
+                        cycle = [dep]
+                        current = component
+                        while current != dep:
+                            cycle.append(current)
+                            current = parent[current]
+                        cycle.append(dep)
+                        cycle.reverse()
+                        return cycle
+                
+                if not advanced:
+                    color[component] = BLACK
+                    stack.pop()
         
-        dist = {comp: float('-inf') for comp in self.graph.components}
-        dist[start] = 0.0
-        parent = {comp: None for comp in self.graph.components}
+        return None
+    
+    def find_strongly_connected_components(self) -> List[List[str]]:
+        index_counter = 0
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        scc_stack: List[str] = []
+        result = []
         
-        for i in range(start_idx, len(topo_order)):
-            current = topo_order[i]
-            if dist[current] == float('-inf'):
+        for root in self.graph.components:
+            if root in index:
                 continue
             
-            for neighbor in self.graph.get_dependencies(current):
-                weight = self.graph.get_weight(current, neighbor)
-                new_dist = dist[current] + weight
+            index[root] = lowlink[root] = index_counter
+            index_counter += 1
+            scc_stack.append(root)
+            on_stack.add(root)
+            stack = [(root, iter(self.graph.get_dependencies(root)))]
+            
+            while stack:
+                component, neighbors = stack[-1]
+                advanced = False
+                
+                for dep in neighbors:
+                    if dep not in index:
+                        index[dep] = lowlink[dep] = index_counter
+                        index_counter += 1
+                        scc_stack.append(dep)
+                        on_stack.add(dep)
+                        stack.append((dep, iter(self.graph.get_dependencies(dep))))
+                        advanced = True
+                        break
+                    
+                    if dep in on_stack and index[dep] < lowlink[component]:
+                        lowlink[component] = index[dep]
+                
+                if advanced:
+                    continue
+                
+                stack.pop()
+                if stack:
+                    caller = stack[-1][0]
+                    if lowlink[component] < lowlink[caller]:
+                        lowlink[caller] = lowlink[component]
                 
-                if new_dist > dist[neighbor]:
-                    dist[neighbor] = new_dist
-                    parent[neighbor] = current
+                if lowlink[component] == index[component]:
+                    scc = []
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack.discard(member)
+                        scc.append(member)
+                        if member == component:
+                            break
+                    result.append(scc)
         
-        max_dist = float('-inf')
-        max_vertex = None
+        return result
+    
+    def clear_cache(self):
+        self.dfs_cache.clear()
+        self.schedule_cache.clear()
+        self.longest_from.clear()
+        self.next_on_path.clear()
+        self.project_duration = 0.0
+        self._schedule_version = -1
+    
+    def analyze_schedule(self) -> Dict[str, Tuple[float, float, float]]:
+        if not self.graph.is_acyclic():
+            raise ValueError("Граф содержит циклы. Критический путь можно найти только в ациклическом графе.")
         
-        for comp, d in dist.items():
-            if d > max_dist and d != float('-inf'):
-                max_dist = d
-                max_vertex = comp
+        if self._schedule_version == self.graph.version:
+            return self.schedule_cache
+        
+        topo_order = self.graph._kahn_order()
+        graph = self.graph.graph
+        weights = self.graph.weights
+        
+        earliest = {comp: 0.0 for comp in topo_order}
+        for current in topo_order:
+            current_earliest = earliest[current]
+            for neighbor in graph[current]:
+                new_dist = current_earliest + weights.get((current, neighbor), 1.0)
+                if new_dist > earliest[neighbor]:
+                    earliest[neighbor] = new_dist
+        
+        longest_from: Dict[str, float] = {}
+        next_on_path: Dict[str, Optional[str]] = {}
+        for current in reversed(topo_order):
+            best = 0.0
+            best_next = None
+            for neighbor in graph[current]:
+                new_dist = weights.get((current, neighbor), 1.0) + longest_from[neighbor]
+                if new_dist > best:
+                    best = new_dist
+                    best_next = neighbor
+            longest_from[current] = best
+            next_on_path[current] = best_next
+        
+        project_duration = max(earliest.values(), default=0.0)
+        
+        schedule = {}
+        for comp in topo_order:
+            latest = project_duration - longest_from[comp]
+            schedule[comp] = (earliest[comp], latest, latest - earliest[comp])
+        
+        self.schedule_cache = schedule
+        self.longest_from = longest_from
+        self.next_on_path = next_on_path
+        self.project_duration = project_duration
+        self._schedule_version = self.graph.version
+        
+        return schedule
+    
+    def get_critical_components(self) -> List[str]:
+        schedule = self.analyze_schedule()
+        return [comp for comp in self.graph._kahn_order() if abs(schedule[comp][2]) < 1e-9]
+    
+    def find_critical_path(self, start: str) -> Tuple[List[str], float]:
+        if not self.graph.is_acyclic():
+            raise ValueError("Граф содержит циклы. Критический путь можно найти только в ациклическом графе.")
         
-        if max_vertex is None:
+        if start not in self.graph.components:
             return [], 0.0
         
+        self.analyze_schedule()
+        
         path = []
-        current = max_vertex
+        current = start
         while current is not None:
             path.append(current)
-            current = parent[current]
+            current = self.next_on_path[current]
         
-        path.reverse()
+        return path, self.longest_from[start]
+    
+    def find_all_critical_paths(self) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+        self.analyze_schedule()
+        return dict(self.longest_from), dict(self.next_on_path)
+    
+    def extract_neighborhood(self, component: str, depth: int = 1,
+                             direction: str = "both") -> DependencyGraph:
+        if direction not in ("out", "in", "both"):
+            raise ValueError("direction должен быть 'out', 'in' или 'both'")
+        
+        subgraph = DependencyGraph()
+        if component not in self.graph.components:
+            return subgraph
+        
+        selected = {component}
+        frontier = [component]
+        for _ in range(depth):
+            next_frontier = []
+            for current in frontier:
+                neighbors = []
+                if direction in ("out", "both"):
+                    neighbors.extend(self.graph.graph[current])
+                if direction in ("in", "both"):
+                    neighbors.extend(self.graph.reverse_graph[current])
+                for neighbor in neighbors:
+                    if neighbor not in selected:
+                        selected.add(neighbor)
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        
+        for comp in selected:
+            subgraph.add_component(comp)
+            for dep in self.graph.graph[comp]:
+                if dep in selected:
+                    subgraph.add_dependency(comp, dep, self.graph.get_weight(comp, dep))
+        
+        return subgraph
+    
+    def collapse_components(self, group_of: Optional[Callable[[str], str]] = None
+                            ) -> Tuple[DependencyGraph, Dict[str, str]]:
+        membership: Dict[str, str] = {}
+        
+        if group_of is None:
+            for scc in self.find_strongly_connected_components():
+                name = scc[0] if len(scc) == 1 else f"{min(scc)} (+{len(scc) - 1})"
+                for comp in scc:
+                    membership[comp] = name
+        else:
+            for comp in self.graph.components:
+                membership[comp] = group_of(comp)
+        
+        collapsed = DependencyGraph()
+        for comp in self.graph.components:
+            collapsed.add_component(membership[comp])
+        
+        for from_comp in self.graph.graph:
+            from_group = membership[from_comp]
+            for to_comp in self.graph.graph[from_comp]:
+                to_group = membership[to_comp]
+                if from_group == to_group:
+                    continue
+                weight = self.graph.get_weight(from_comp, to_comp)
+                if weight > collapsed.weights.get((from_group, to_group), float('-inf')):
+                    collapsed.add_dependency(from_group, to_group, weight)
         
-        return path, max_dist
+        return collapsed, membership
     
-    def visualize_graph(self, filename: str = "dependency_graph.png", 
-                       highlight_component: Optional[str] = None):
-        if not VISUALIZATION_AVAILABLE:
-            raise ImportError(
-                "Для визуализации необходимо установить networkx и matplotlib.\n"
-                "Выполните: pip install networkx matplotlib"
+    def compute_layered_layout(self) -> Dict[str, Tuple[float, float]]:
+        topo_order = self.graph.get_topological_order()
+        if topo_order is None:
+            raise ValueError(
+                "Послойная раскладка требует ациклического графа. "
+                "Сначала сверните циклы через collapse_components()."
             )
         
+        layer_of = {comp: 0 for comp in topo_order}
+        for current in topo_order:
+            for neighbor in self.graph.graph[current]:
+                if layer_of[current] + 1 > layer_of[neighbor]:
+                    layer_of[neighbor] = layer_of[current] + 1
+        
+        layers: Dict[int, List[str]] = defaultdict(list)
+        for comp in topo_order:
+            layers[layer_of[comp]].append(comp)
+        
+        position_in_layer: Dict[str, float] = {}
+        pos: Dict[str, Tuple[float, float]] = {}
+        
+        for level in range(len(layers)):
+            layer = layers[level]
+            if level > 0:
+                barycenter = {}
+                for comp in layer:
+                    parents = self.graph.reverse_graph[comp]
+                    if parents:
+                        barycenter[comp] = sum(position_in_layer[p] for p in parents) / len(parents)
+                    else:
+                        barycenter[comp] = 0.0
+                layer.sort(key=lambda comp: barycenter[comp])
+            
+            offset = (len(layer) - 1) / 2.0
+            for i, comp in enumerate(layer):
+                position_in_layer[comp] = i - offset
+                pos[comp] = (i - offset, -float(level))
+        
+        return pos
+    
+    def export_dot(self, filename: str = "dependency_graph.dot",
+                   highlight_component: Optional[str] = None,
+                   show_weights: bool = True):
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write("digraph dependencies {\n")
+            f.write("  rankdir=TB;\n")
+            f.write("  node [shape=box, style=filled, fillcolor=lightblue];\n")
+            
+            for comp in sorted(self.graph.components):
+                name = _dot_escape(comp)
+                if comp == highlight_component:
+                    f.write(f'  "{name}" [fillcolor=red];\n')
+                else:
+                    f.write(f'  "{name}";\n')
+            
+            for from_comp in self.graph.graph:
+                from_name = _dot_escape(from_comp)
+                for to_comp in self.graph.graph[from_comp]:
+                    to_name = _dot_escape(to_comp)
+                    if show_weights:
+                        weight = self.graph.get_weight(from_comp, to_comp)
+                        f.write(f'  "{from_name}" -> "{to_name}" [label="{weight:.1f}"];\n')
+                    else:
+                        f.write(f'  "{from_name}" -> "{to_name}";\n')
+            
+            f.write("}\n")
+        
+        print(f"Граф сохранён в файл: {filename}")
+    
+    def export_svg(self, filename: str = "dependency_graph.svg",
+                   highlight_component: Optional[str] = None,
+                   show_labels: Optional[bool] = None,
+                   max_labeled_nodes: int = 500):
+        pos = self.compute_layered_layout()
+        if show_labels is None:
+            show_labels = len(pos) <= max_labeled_nodes
+        
+        x_step, y_step, margin, radius = 120.0, 80.0, 60.0, 18.0
+        min_x = min((x for x, _ in pos.values()), default=0.0)
+        max_x = max((x for x, _ in pos.values()), default=0.0)
+        min_y = min((y for _, y in pos.values()), default=0.0)
+        width = (max_x - min_x) * x_step + 2 * margin
+        height = -min_y * y_step + 2 * margin
+        
+        def to_canvas(comp: str) -> Tuple[float, float]:
+            x, y = pos[comp]
+            return (x - min_x) * x_step + margin, -y * y_step + margin
+        
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.0f}" '
+                    f'height="{height:.0f}" viewBox="0 0 {width:.0f} {height:.0f}">\n')
+            f.write('<defs><marker id="arrow" viewBox="0 0 10 10" refX="10" refY="5" '
+                    'markerWidth="6" markerHeight="6" orient="auto">'
+                    '<path d="M0,0 L10,5 L0,10 z" fill="gray"/></marker></defs>\n')
+            
+            f.write('<g stroke="gray" stroke-width="1" marker-end="url(#arrow)">\n')
+            for from_comp in self.graph.graph:
+                x1, y1 = to_canvas(from_comp)
+                for to_comp in self.graph.graph[from_comp]:
+                    x2, y2 = to_canvas(to_comp)
+                    length = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5 or 1.0
+                    x2 -= (x2 - x1) * radius / length
+                    y2 -= (y2 - y1) * radius / length
+                    f.write(f'<line x1="{x1:.1f}" y1="{y1:.1f}" x2="{x2:.1f}" y2="{y2:.1f}"/>\n')
+            f.write('</g>\n')
+            
+            f.write('<g font-family="sans-serif" font-size="10" text-anchor="middle">\n')
+            for comp in pos:
+                x, y = to_canvas(comp)
+                color = 'red' if comp == highlight_component else 'lightblue'
+                f.write(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="{radius:.0f}" fill="{color}"/>\n')
+                if show_labels:
+                    f.write(f'<text x="{x:.1f}" y="{y + 3:.1f}">{escape(comp)}</text>\n')
+            f.write('</g>\n')
+            f.write('</svg>\n')
+        
+        print(f"Граф сохранён в файл: {filename}")
+    
+    def visualize_graph(self, filename: str = "dependency_graph.png", 
+                       highlight_component: Optional[str] = None,
+                       layout: str = "spring", show_labels: Optional[bool] = None,
+                       dpi: int = 300, max_labeled_nodes: int = 200):
+        if layout not in ("spring", "layered"):
+            raise ValueError("layout должен быть 'spring' или 'layered'")
+        
+        nx, plt = _load_visualization()
+        
         G = nx.DiGraph()
         
         for from_comp in self.graph.graph:
@@ -230,8 +624,17 @@ class DependencyAnalyzer:
                 weight = self.graph.get_weight(from_comp, to_comp)
                 G.add_edge(from_comp, to_comp, weight=weight)
         
+        for comp in self.graph.components:
+            G.add_node(comp)
+        
+        if show_labels is None:
+            show_labels = G.number_of_nodes() <= max_labeled_nodes
+        
         plt.figure(figsize=(12, 8))
-        pos = nx.spring_layout(G, k=2, iterations=50)
+        if layout == "layered":
+            pos = self.compute_layered_layout()
+        else:
+            pos = nx.spring_layout(G, k=2, iterations=50)
         
         nx.draw_networkx_edges(G, pos, edge_color='gray', 
                               arrows=True, arrowsize=20, 
@@ -247,16 +650,17 @@ class DependencyAnalyzer:
         nx.draw_networkx_nodes(G, pos, node_color=node_colors, 
                               node_size=2000, alpha=0.9)
         
-        nx.draw_networkx_labels(G, pos, font_size=10, font_weight='bold')
-        
-        edge_labels = {(u, v): f"{d['weight']:.1f}" 
-                       for u, v, d in G.edges(data=True)}
-        nx.draw_networkx_edge_labels(G, pos, edge_labels, font_size=8)
+        if show_labels:
+            nx.draw_networkx_labels(G, pos, font_size=10, font_weight='bold')
+            
+            edge_labels = {(u, v): f"{d['weight']:.1f}" 
+                           for u, v, d in G.edges(data=True)}
+            nx.draw_networkx_edge_labels(G, pos, edge_labels, font_size=8)
         
         plt.title("Граф зависимостей проекта", fontsize=16, fontweight='bold')
         plt.axis('off')
         plt.tight_layout()
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
+        plt.savefig(filename, dpi=dpi, bbox_inches='tight')
         plt.close()
         
         print(f"Граф сохранён в файл: {filename}")
@@ -0,0 +1,159 @@
+import argparse
+import asyncio
+import json
+import socket
+from typing import Any, Dict, Optional, Tuple, Union
+
+from dependency_analyzer import DependencyGraph, DependencyAnalyzer
+
+
+class DependencyServer:
+    
+    def __init__(self, graph: DependencyGraph):
+        self.graph = graph
+        self.analyzer = DependencyAnalyzer(graph)
+        self.handlers = {
+            "bfs": self._handle_bfs,
+            "closure": self._handle_closure,
+            "reverse": self._handle_reverse,
+            "topological_order": self._handle_topological_order,
+            "critical_path": self._handle_critical_path,
+            "add_dependency": self._handle_add_dependency,
+            "remove_dependency": self._handle_remove_dependency,
+            "stats": self._handle_stats,
+        }
+    
+    def _handle_bfs(self, request: Dict[str, Any]) -> Any:
+        if "components" in request:
+            return self.analyzer.find_dependencies_bfs_batch(request["components"],
+                                                             request.get("max_depth"))
+        return self.analyzer.find_dependencies_bfs(request["component"], request.get("max_depth"))
+    
+    def _handle_closure(self, request: Dict[str, Any]) -> Any:
+        return sorted(self.analyzer.find_dependencies_dfs(request["component"]))
+    
+    def _handle_reverse(self, request: Dict[str, Any]) -> Any:
+        if request.get("transitive", True):
+            return sorted(self.analyzer.find_dependents(request["component"]))
+        return sorted(self.graph.reverse_graph.get(request["component"], []))
+    
+    def _handle_topological_order(self, request: Dict[str, Any]) -> Any:
+        return self.graph.get_topological_order()
+    
+    def _handle_critical_path(self, request: Dict[str, Any]) -> Any:
+        path, weight = self.analyzer.find_critical_path(request["component"])
+        return {"path": path, "weight": weight}
+    
+    def _handle_add_dependency(self, request: Dict[str, Any]) -> Any:
+        from_component, to_component = request["from"], request["to"]
+        if not isinstance(from_component, str) or not isinstance(to_component, str):
+            raise ValueError("Компоненты зависимости должны быть строками")
+        
+        weight = float(request.get("weight", 1.0))
+        self.analyzer.add_dependency(from_component, to_component, weight)
+        return self.graph.version
+    
+    def _handle_remove_dependency(self, request: Dict[str, Any]) -> Any:
+        return self.analyzer.remove_dependency(request["from"], request["to"])
+    
+    def _handle_stats(self, request: Dict[str, Any]) -> Any:
+        return {
+            "components": len(self.graph.components),
+            "dependencies": len(self.graph.weights),
+            "version": self.graph.version,
+            "cached_closures": len(self.analyzer.dfs_cache),
+        }
+    
+    def handle_request(self, request: Any) -> Dict[str, Any]:
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "Запрос должен быть JSON-объектом"}
+        
+        op = request.get("op")
+        if not isinstance(op, str) or op not in self.handlers:
+            return {"ok": False, "error": f"Неизвестная операция: {op}"}
+        
+        handler = self.handlers[op]
+        
+        try:
+            return {"ok": True, "result": handler(request)}
+        except KeyError as e:
+            return {"ok": False, "error": f"Не указан параметр запроса: {e.args[0]}"}
+        except (ValueError, TypeError) as e:
+            return {"ok": False, "error": str(e)}
+    
+    async def _serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    response = {"ok": False, "error": "Слишком длинный запрос"}
+                else:
+                    if not line:
+                        break
+                    
+                    try:
+                        request = json.loads(line)
+                    except ValueError:
+                        response = {"ok": False, "error": "Некорректный JSON"}
+                    else:
+                        response = self.handle_request(request)
+                
+                writer.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+    
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765,
+                    unix_socket: Optional[str] = None):
+        if unix_socket is not None:
+            server = await asyncio.start_unix_server(self._serve_client, path=unix_socket)
+            print(f"Сервер зависимостей слушает сокет {unix_socket}")
+        else:
+            server = await asyncio.start_server(self._serve_client, host, port)
+            print(f"Сервер зависимостей слушает {host}:{port}")
+        
+        async with server:
+            await server.serve_forever()
+
+
+def query(request: Dict[str, Any], address: Union[str, Tuple[str, int]] = ("127.0.0.1", 8765)) -> Any:
+    if isinstance(address, str):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    
+    with sock:
+        sock.connect(address)
+        sock.sendall(json.dumps(request, ensure_ascii=False).encode('utf-8') + b"\n")
+        with sock.makefile('rb') as stream:
+            response = json.loads(stream.readline())
+    
+    if not response["ok"]:
+        raise ValueError(response["error"])
+    return response["result"]
+
+
+def main():
+    from example import load_dependencies_from_file
+    
+    parser = argparse.ArgumentParser(description="Сервер запросов к графу зависимостей")
+    parser.add_argument("filename", nargs="?", default="dependencies.txt",
+                        help="файл с зависимостями")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--socket", dest="unix_socket", default=None,
+                        help="путь к Unix-сокету вместо TCP")
+    args = parser.parse_args()
+    
+    graph = load_dependencies_from_file(args.filename)
+    server = DependencyServer(graph)
+    
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix_socket))
+    except KeyboardInterrupt:
+        print("Сервер остановлен")
+
+
+if __name__ == "__main__":
+    main()
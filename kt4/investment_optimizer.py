@@ -1,16 +1,39 @@
+from importlib.util import find_spec
 from typing import List, Tuple, Dict
 
-try:
-    import matplotlib.pyplot as plt
-    VISUALIZATION_AVAILABLE = True
-except ImportError:
-    VISUALIZATION_AVAILABLE = False
-    plt = None
+VISUALIZATION_AVAILABLE = find_spec("matplotlib") is not None
+NUMPY_AVAILABLE = find_spec("numpy") is not None
+
+
+def _load_pyplot():
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError:
+        raise ImportError(
+            "Для визуализации необходимо установить matplotlib.\n"
+            "Выполните: pip install matplotlib"
+        ) from None
+    return plt
+
+
+def _load_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "Для векторизованного ДП необходимо установить numpy.\n"
+            "Выполните: pip install numpy"
+        ) from None
+    return np
 
 
 class InvestmentOptimizer:
     
-    def max_profit_1d(self, stocks: List[Tuple[int, int]], budget: int) -> Tuple[int, List[int]]:
+    def max_profit_1d(self, stocks: List[Tuple[int, int]], budget: int,
+                      vectorized: bool = False) -> Tuple[int, List[int]]:
+        if vectorized:
+            return self._max_profit_1d_numpy(stocks, budget)
+        
         n = len(stocks)
         dp = [0] * (budget + 1)
         selected = [[] for _ in range(budget + 1)]
@@ -27,6 +50,35 @@ class InvestmentOptimizer:
         
         return max_profit, selected_stocks
     
+    def _max_profit_1d_numpy(self, stocks: List[Tuple[int, int]], budget: int) -> Tuple[int, List[int]]:
+        np = _load_numpy()
+        
+        dtype = np.int64 if all(isinstance(profit, int) for _, profit in stocks) else np.float64
+        dp = np.zeros(budget + 1, dtype=dtype)
+        taken = np.zeros(budget + 1, dtype=bool)
+        buffer = np.empty(budget + 1, dtype=dtype)
+        decisions = np.zeros((len(stocks), (budget + 8) // 8), dtype=np.uint8)
+        
+        for i, (cost, profit) in enumerate(stocks):
+            if cost > budget:
+                continue
+            
+            candidate = np.add(dp[:budget + 1 - cost], profit, out=buffer[:budget + 1 - cost])
+            taken[:cost] = False
+            np.greater(candidate, dp[cost:], out=taken[cost:])
+            np.maximum(dp[cost:], candidate, out=dp[cost:])
+            decisions[i] = np.packbits(taken)
+        
+        selected_stocks = []
+        j = budget
+        for i in range(len(stocks) - 1, -1, -1):
+            if decisions[i, j >> 3] >> (7 - (j & 7)) & 1:
+                selected_stocks.append(i)
+                j -= stocks[i][0]
+        selected_stocks.reverse()
+        
+        return dp[budget].item(), selected_stocks
+    
     def max_profit_2d(self, stocks: List[Tuple[int, int]], bonds_yield: float, 
                      total_budget: int, risk_limit: float) -> Tuple[float, int, int]:
         max_stocks_budget = int(total_budget * risk_limit)
@@ -121,11 +173,7 @@ class InvestmentOptimizer:
     
     def visualize_profit_vs_budget(self, stocks: List[Tuple[int, int]], 
                                    max_budget: int, step: int = 10):
-        if not VISUALIZATION_AVAILABLE:
-            raise ImportError(
-                "Для визуализации необходимо установить matplotlib.\n"
-                "Выполните: pip install matplotlib"
-            )
+        plt = _load_pyplot()
         
         budgets = list(range(0, max_budget + 1, step))
         profits_dp = []
@@ -1,4 +1,9 @@
-from transport_network import TransportGraph, NetworkOptimizer
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from transport import TransportGraph, NetworkOptimizer
 
 
 def create_example_network():
@@ -0,0 +1,13 @@
+from .network import (
+    BACKENDS,
+    CompactGraph,
+    DynamicShortestPaths,
+    IndexedHeap,
+    NetworkOptimizer,
+    ReachabilityIndex,
+    TransportGraph,
+    coordinate_heuristic,
+    register_backend,
+)
+from .contraction_hierarchy import ContractionHierarchy
+from .timetable import TimetableRouter
@@ -0,0 +1,66 @@
+import argparse
+import random
+import time
+import tracemalloc
+
+from .network import BACKENDS, TransportGraph, NetworkOptimizer
+
+
+def create_dense_network(stations: int, density: float, seed: int = 42,
+                         backend: str = "python") -> TransportGraph:
+    rng = random.Random(seed)
+    graph = TransportGraph(backend)
+    for i in range(stations):
+        graph.add_station(f"S{i}")
+    for i in range(stations):
+        for j in range(i + 1, stations):
+            if rng.random() < density:
+                weight = rng.uniform(1.0, 100.0)
+                graph.add_route(f"S{i}", f"S{j}", weight)
+                graph.add_route(f"S{j}", f"S{i}", weight)
+    return graph
+
+
+def measure(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    
+    tracemalloc.start()
+    func(*args, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сравнение ленивой кучи и кучи с decrease-key")
+    parser.add_argument("--stations", type=int, default=1500)
+    parser.add_argument("--density", type=float, default=0.3)
+    parser.add_argument("--frozen", action="store_true", help="запуск на CSR-представлении")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="python")
+    args = parser.parse_args()
+    
+    graph = create_dense_network(args.stations, args.density, backend=args.backend)
+    if args.frozen:
+        graph.freeze()
+    else:
+        graph._engine()
+    optimizer = NetworkOptimizer(graph)
+    print(f"Станций: {len(graph.stations)}, рёбер: {len(graph.edges)}")
+    print(f"{'Алгоритм':<12}{'Куча':<12}{'Время, с':>12}{'Пик памяти, МБ':>18}")
+    
+    for name, lazy_call, indexed_call in [
+        ("Дейкстра", lambda: graph.shortest_path_Dijkstra("S0"),
+         lambda: graph.shortest_path_Dijkstra("S0", indexed_heap=True)),
+        ("Прим", lambda: optimizer.minimum_spanning_tree_Prim("S0"),
+         lambda: optimizer.minimum_spanning_tree_Prim("S0", indexed_heap=True)),
+    ]:
+        _, lazy_time, lazy_peak = measure(lazy_call)
+        _, indexed_time, indexed_peak = measure(indexed_call)
+        print(f"{name:<12}{'ленивая':<12}{lazy_time:>12.3f}{lazy_peak / 2**20:>18.2f}")
+        print(f"{name:<12}{'индексная':<12}{indexed_time:>12.3f}{indexed_peak / 2**20:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
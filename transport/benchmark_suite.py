@@ -0,0 +1,167 @@
+import argparse
+import json
+import math
+import random
+import sys
+from typing import Callable, Dict, List, Tuple
+
+from .benchmark_heap import measure
+from .network import BACKENDS, TransportGraph, NetworkOptimizer
+
+
+def create_grid_network(size: int, seed: int = 42, backend: str = "python") -> TransportGraph:
+    rng = random.Random(seed)
+    graph = TransportGraph(backend)
+    side = math.isqrt(size - 1) + 1 if size > 0 else 1
+    for i in range(size):
+        graph.add_station(f"S{i}")
+        row, col = divmod(i, side)
+        for neighbor in ((i - 1) if col > 0 else -1, (i - side) if row > 0 else -1):
+            if neighbor >= 0:
+                weight = rng.uniform(1.0, 10.0)
+                graph.add_route(f"S{i}", f"S{neighbor}", weight)
+                graph.add_route(f"S{neighbor}", f"S{i}", weight)
+    return graph
+
+
+def create_geometric_network(size: int, seed: int = 42, backend: str = "python") -> TransportGraph:
+    rng = random.Random(seed)
+    graph = TransportGraph(backend)
+    points = [(rng.random(), rng.random()) for _ in range(size)]
+    radius = math.sqrt(2.0 * math.log(max(size, 2)) / (math.pi * max(size, 1)))
+    cells: Dict[Tuple[int, int], List[int]] = {}
+    for i, (x, y) in enumerate(points):
+        graph.add_station(f"S{i}")
+        cells.setdefault((int(x / radius), int(y / radius)), []).append(i)
+    
+    for (cx, cy), members in cells.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for j in cells.get((cx + dx, cy + dy), []):
+                    for i in members:
+                        if i < j:
+                            distance = math.dist(points[i], points[j])
+                            if distance <= radius:
+                                graph.add_route(f"S{i}", f"S{j}", distance * 100.0)
+                                graph.add_route(f"S{j}", f"S{i}", distance * 100.0)
+    return graph
+
+
+def create_scale_free_network(size: int, seed: int = 42, backend: str = "python",
+                              links: int = 2) -> TransportGraph:
+    rng = random.Random(seed)
+    graph = TransportGraph(backend)
+    endpoints: List[int] = []
+    for i in range(size):
+        graph.add_station(f"S{i}")
+        targets = set()
+        if i <= links:
+            targets.update(range(i))
+        else:
+            while len(targets) < links:
+                targets.add(rng.choice(endpoints))
+        for j in targets:
+            weight = rng.uniform(1.0, 10.0)
+            graph.add_route(f"S{i}", f"S{j}", weight)
+            graph.add_route(f"S{j}", f"S{i}", weight)
+            endpoints.extend((i, j))
+    return graph
+
+
+GENERATORS: Dict[str, Callable[..., TransportGraph]] = {
+    "grid": create_grid_network,
+    "geometric": create_geometric_network,
+    "scale_free": create_scale_free_network,
+}
+
+
+def same_distances(a: Dict[str, float], b: Dict[str, float]) -> bool:
+    return a.keys() == b.keys() and all(
+        a[station] == b[station] or math.isclose(a[station], b[station], rel_tol=1e-9)
+        for station in a)
+
+
+def run_case(kind: str, size: int, backend: str, seed: int, max_all_pairs: int) -> Tuple[Dict, List[Dict], List[Dict]]:
+    graph = GENERATORS[kind](size, seed=seed, backend=backend)
+    graph._engine()
+    optimizer = NetworkOptimizer(graph)
+    start = "S0"
+    network = {"kind": kind, "size": size, "backend": backend,
+               "stations": len(graph.stations), "routes": len(graph.edges)}
+    timings = []
+    results = {}
+    
+    algorithms = [
+        ("dijkstra", lambda: graph.shortest_path_Dijkstra(start)),
+        ("bellman_ford", lambda: graph.shortest_path_BellmanFord(start)),
+        ("kruskal", optimizer.minimum_spanning_tree_Kruskal),
+        ("prim", lambda: optimizer.minimum_spanning_tree_Prim(start)),
+    ]
+    if size <= max_all_pairs:
+        algorithms.append(("floyd_warshall", graph.all_pairs_shortest_paths_FloydWarshall))
+    
+    for name, call in algorithms:
+        results[name], elapsed, peak = measure(call)
+        timings.append({"kind": kind, "size": size, "backend": backend, "algorithm": name,
+                        "seconds": elapsed, "peak_bytes": peak})
+    
+    dijkstra = results["dijkstra"]
+    bellman_ford, has_negative_cycle = results["bellman_ford"]
+    mst_kruskal, total_kruskal = results["kruskal"]
+    mst_prim, total_prim = results["prim"]
+    connected = all(math.isfinite(d) for d in dijkstra.values())
+    
+    checks = [
+        ("dijkstra == bellman_ford", not has_negative_cycle and same_distances(dijkstra, bellman_ford)),
+    ]
+    if "floyd_warshall" in results:
+        row = results["floyd_warshall"][graph.station_index[start]]
+        checks.append(("dijkstra == floyd_warshall",
+                       same_distances(dijkstra, graph._names_to_values(row))))
+    if connected:
+        checks.append(("kruskal == prim", len(mst_kruskal) == len(mst_prim) == len(graph.stations) - 1
+                       and math.isclose(total_kruskal, total_prim, rel_tol=1e-9)))
+    
+    return network, timings, [{"kind": kind, "size": size, "backend": backend, "check": check, "ok": ok}
+                              for check, ok in checks]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Производительность и сверка алгоритмов на сгенерированных сетях")
+    parser.add_argument("--kinds", nargs="+", choices=sorted(GENERATORS), default=sorted(GENERATORS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 400, 1600])
+    parser.add_argument("--backends", nargs="+", choices=sorted(BACKENDS), default=["python"])
+    parser.add_argument("--max-all-pairs", type=int, default=150,
+                        help="Флойд-Уоршелл запускается только для сетей не больше этого размера")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args()
+    
+    report = {"networks": [], "timings": [], "checks": []}
+    print(f"{'Сеть':<12}{'Станций':>9}{'Движок':>10}  {'Алгоритм':<16}{'Время, с':>10}{'Пик памяти, МБ':>18}")
+    
+    for kind in args.kinds:
+        for size in args.sizes:
+            for backend in args.backends:
+                network, timings, checks = run_case(kind, size, backend, args.seed, args.max_all_pairs)
+                report["networks"].append(network)
+                report["timings"].extend(timings)
+                report["checks"].extend(checks)
+                for row in timings:
+                    print(f"{kind:<12}{size:>9}{backend:>10}  {row['algorithm']:<16}"
+                          f"{row['seconds']:>10.3f}{row['peak_bytes'] / 2**20:>18.2f}")
+                for check in checks:
+                    if not check["ok"]:
+                        print(f"РАСХОЖДЕНИЕ: {kind}, {size} станций, {backend}: {check['check']}")
+    
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    
+    failed = sum(1 for check in report["checks"] if not check["ok"])
+    print(f"Проверок: {len(report['checks'])}, расхождений: {failed}. Результаты: {args.output}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+from typing import Dict, List, Tuple, Optional
+import heapq
+import pickle
+
+from .network import TransportGraph
+
+_PRIORITY_HOPS = 3
+_PRIORITY_SETTLE_LIMIT = 10
+_PRIORITY_SEARCH_PAIRS = 100
+
+
+class ContractionHierarchy:
+    
+    def __init__(self, stations: List[str], rank: List[int],
+                 up_forward: List[List[Tuple[int, float]]],
+                 up_backward: List[List[Tuple[int, float]]],
+                 middle: Dict[Tuple[int, int], int]):
+        self.stations = stations
+        self.station_index: Dict[str, int] = {name: i for i, name in enumerate(stations)}
+        self.rank = rank
+        self.up_forward = up_forward
+        self.up_backward = up_backward
+        self.middle = middle
+    
+    @classmethod
+    def build(cls, graph: TransportGraph, settle_limit: int = 500,
+              hop_limit: int = 8) -> "ContractionHierarchy":
+        n = len(graph.station_index)
+        stations = [graph.index_station[i] for i in range(n)]
+        
+        out_edges: List[Dict[int, float]] = [{} for _ in range(n)]
+        in_edges: List[Dict[int, float]] = [{} for _ in range(n)]
+        middle: Dict[Tuple[int, int], int] = {}
+        
+        for from_station, to_station, weight in graph.edges:
+            if weight < 0:
+                raise ValueError("Иерархия сжатия не поддерживает отрицательные веса")
+            u = graph.station_index[from_station]
+            v = graph.station_index[to_station]
+            if u != v and weight < out_edges[u].get(v, float('inf')):
+                out_edges[u][v] = weight
+                in_edges[v][u] = weight
+                middle[(u, v)] = -1
+        
+        contracted_neighbors = [0] * n
+        level = [0] * n
+        
+        def witness_distance(source: int, excluded: int, limit: float,
+                             targets: Dict[int, float], max_hops: int,
+                             max_settled: int) -> Dict[int, float]:
+            distances = {source: 0.0}
+            heap = [(0.0, source, 0)]
+            settled = 0
+            remaining = len(targets)
+            
+            while heap and settled < max_settled and remaining > 0:
+                current_dist, current, hops = heapq.heappop(heap)
+                if current_dist > distances[current]:
+                    continue
+                if current_dist > limit:
+                    break
+                
+                settled += 1
+                if current in targets:
+                    remaining -= 1
+                if hops == max_hops:
+                    continue
+                
+                for neighbor, weight in out_edges[current].items():
+                    if neighbor == excluded:
+                        continue
+                    new_dist = current_dist + weight
+                    if new_dist <= limit and new_dist < distances.get(neighbor, float('inf')):
+                        distances[neighbor] = new_dist
+                        heapq.heappush(heap, (new_dist, neighbor, hops + 1))
+            
+            return distances
+        
+        def shortcuts_for(node: int, max_hops: int, max_settled: int) -> List[Tuple[int, int, float]]:
+            shortcuts = []
+            outgoing = out_edges[node]
+            if not outgoing:
+                return shortcuts
+            
+            for u, weight_in in in_edges[node].items():
+                targets = {w: weight_in + weight_out for w, weight_out in outgoing.items() if w != u}
+                if not targets:
+                    continue
+                
+                distances = witness_distance(u, node, max(targets.values()), targets, max_hops, max_settled)
+                for w, through_node in targets.items():
+                    if distances.get(w, float('inf')) > through_node:
+                        shortcuts.append((u, w, through_node))
+            
+            return shortcuts
+        
+        def priority(node: int) -> int:
+            outgoing = out_edges[node]
+            if len(in_edges[node]) * len(outgoing) <= _PRIORITY_SEARCH_PAIRS:
+                shortcuts = len(shortcuts_for(node, _PRIORITY_HOPS, _PRIORITY_SETTLE_LIMIT))
+            else:
+                shortcuts = 0
+                for u, weight_in in in_edges[node].items():
+                    direct = out_edges[u]
+                    for w, weight_out in outgoing.items():
+                        if w != u and direct.get(w, float('inf')) > weight_in + weight_out:
+                            shortcuts += 1
+            degree = len(in_edges[node]) + len(outgoing)
+            return 2 * (shortcuts - degree) + contracted_neighbors[node] + level[node]
+        
+        priorities = [priority(node) for node in range(n)]
+        heap = [(value, node) for node, value in enumerate(priorities)]
+        heapq.heapify(heap)
+        contracted = [False] * n
+        rank = [0] * n
+        next_rank = 0
+        up_forward: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+        up_backward: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+        
+        while heap:
+            node_priority, node = heapq.heappop(heap)
+            if contracted[node] or node_priority != priorities[node]:
+                continue
+            
+            for u, w, weight in shortcuts_for(node, hop_limit, settle_limit):
+                if weight < out_edges[u].get(w, float('inf')):
+                    out_edges[u][w] = weight
+                    in_edges[w][u] = weight
+                    middle[(u, w)] = node
+            
+            contracted[node] = True
+            rank[node] = next_rank
+            next_rank += 1
+            
+            for w, weight in out_edges[node].items():
+                up_forward[node].append((w, weight))
+                del in_edges[w][node]
+            for u, weight in in_edges[node].items():
+                up_backward[node].append((u, weight))
+                del out_edges[u][node]
+            
+            neighbors = set(out_edges[node]) | set(in_edges[node])
+            out_edges[node] = {}
+            in_edges[node] = {}
+            for neighbor in neighbors:
+                contracted_neighbors[neighbor] += 1
+                level[neighbor] = max(level[neighbor], level[node] + 1)
+                priorities[neighbor] = priority(neighbor)
+                heapq.heappush(heap, (priorities[neighbor], neighbor))
+        
+        return cls(stations, rank, up_forward, up_backward, middle)
+    
+    def save(self, filename: str):
+        with open(filename, 'wb') as f:
+            pickle.dump((self.stations, self.rank, self.up_forward, self.up_backward, self.middle),
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    @classmethod
+    def load(cls, filename: str) -> "ContractionHierarchy":
+        with open(filename, 'rb') as f:
+            stations, rank, up_forward, up_backward, middle = pickle.load(f)
+        return cls(stations, rank, up_forward, up_backward, middle)
+    
+    def _search(self, source: int, target: int) -> Tuple[float, int, Dict[int, int], Dict[int, int]]:
+        distances = ({source: 0.0}, {target: 0.0})
+        parents: Tuple[Dict[int, int], Dict[int, int]] = ({source: -1}, {target: -1})
+        heaps = ([(0.0, source)], [(0.0, target)])
+        adjacency = (self.up_forward, self.up_backward)
+        stall_adjacency = (self.up_backward, self.up_forward)
+        best = float('inf')
+        meeting = -1
+        
+        while heaps[0] or heaps[1]:
+            for side in (0, 1):
+                heap = heaps[side]
+                if not heap:
+                    continue
+                if heap[0][0] >= best:
+                    heap.clear()
+                    continue
+                
+                current_dist, current = heapq.heappop(heap)
+                if current_dist > distances[side][current]:
+                    continue
+                
+                other = distances[1 - side].get(current)
+                if other is not None and current_dist + other < best:
+                    best = current_dist + other
+                    meeting = current
+                
+                if any(distances[side].get(higher, float('inf')) + weight < current_dist
+                       for higher, weight in stall_adjacency[side][current]):
+                    continue
+                
+                for neighbor, weight in adjacency[side][current]:
+                    new_dist = current_dist + weight
+                    if new_dist < distances[side].get(neighbor, float('inf')):
+                        distances[side][neighbor] = new_dist
+                        parents[side][neighbor] = current
+                        heapq.heappush(heap, (new_dist, neighbor))
+        
+        return best, meeting, parents[0], parents[1]
+    
+    def _unpack(self, u: int, w: int, route: List[int]):
+        stack = [(u, w)]
+        while stack:
+            a, b = stack.pop()
+            mid = self.middle[(a, b)]
+            if mid == -1:
+                route.append(b)
+            else:
+                stack.append((mid, b))
+                stack.append((a, mid))
+    
+    def query(self, start: str, target: str) -> float:
+        if start not in self.station_index or target not in self.station_index:
+            return float('inf')
+        
+        best, _, _, _ = self._search(self.station_index[start], self.station_index[target])
+        return best
+    
+    def shortest_route(self, start: str, target: str) -> Tuple[List[str], float]:
+        if start not in self.station_index or target not in self.station_index:
+            return [], float('inf')
+        
+        source = self.station_index[start]
+        destination = self.station_index[target]
+        best, meeting, forward_parent, backward_parent = self._search(source, destination)
+        if meeting == -1:
+            return [], float('inf')
+        
+        forward_chain = []
+        current = meeting
+        while current != -1:
+            forward_chain.append(current)
+            current = forward_parent[current]
+        forward_chain.reverse()
+        
+        backward_chain = []
+        current = backward_parent[meeting]
+        while current != -1:
+            backward_chain.append(current)
+            current = backward_parent[current]
+        
+        chain = forward_chain + backward_chain
+        route = [chain[0]]
+        for a, b in zip(chain, chain[1:]):
+            self._unpack(a, b, route)
+        
+        return [self.stations[i] for i in route], best
+    
+    def get_station_name(self, index: int) -> str:
+        return self.stations[index] if 0 <= index < len(self.stations) else ""
+    
+    def rank_of(self, station: str) -> Optional[int]:
+        index = self.station_index.get(station)
+        return self.rank[index] if index is not None else None
@@ -0,0 +1,1688 @@
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Optional, Set, Union
+import heapq
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+
+def _require_numpy():
+    if not NUMPY_AVAILABLE:
+        raise ImportError(
+            "Для векторизованных алгоритмов необходимо установить numpy.\n"
+            "Выполните: pip install numpy"
+        )
+
+
+_worker_adjacency: List[List[Tuple[int, float]]] = []
+_worker_targets: List[int] = []
+
+
+def _dijkstra_indexed(adjacency: List[List[Tuple[int, float]]], source: int) -> List[float]:
+    distances = [float('inf')] * len(adjacency)
+    distances[source] = 0.0
+    heap = [(0.0, source)]
+    
+    while heap:
+        current_dist, current = heapq.heappop(heap)
+        
+        if current_dist > distances[current]:
+            continue
+        
+        for neighbor, weight in adjacency[current]:
+            new_dist = current_dist + weight
+            if new_dist < distances[neighbor]:
+                distances[neighbor] = new_dist
+                heapq.heappush(heap, (new_dist, neighbor))
+    
+    return distances
+
+
+def _dijkstra_to_targets(adjacency: List[List[Tuple[int, float]]], source: int,
+                         targets: List[int], reachable: Optional[List[int]] = None) -> List[float]:
+    distances = {source: 0.0}
+    pending = set(targets if reachable is None else reachable)
+    heap = [(0.0, source)]
+    
+    while heap and pending:
+        current_dist, current = heapq.heappop(heap)
+        
+        if current_dist > distances[current]:
+            continue
+        
+        pending.discard(current)
+        
+        for neighbor, weight in adjacency[current]:
+            new_dist = current_dist + weight
+            if new_dist < distances.get(neighbor, float('inf')):
+                distances[neighbor] = new_dist
+                heapq.heappush(heap, (new_dist, neighbor))
+    
+    return [distances.get(target, float('inf')) for target in targets]
+
+
+def _init_dijkstra_worker(adjacency: List[List[Tuple[int, float]]],
+                          targets: Optional[List[int]] = None):
+    global _worker_adjacency, _worker_targets
+    _worker_adjacency = adjacency
+    _worker_targets = targets or []
+
+
+def _dijkstra_worker(source: int) -> List[float]:
+    return _dijkstra_indexed(_worker_adjacency, source)
+
+
+def _dijkstra_targets_worker(source: int, reachable: Optional[List[int]] = None) -> List[float]:
+    return _dijkstra_to_targets(_worker_adjacency, source, _worker_targets, reachable)
+
+
+def _weight_order(weights, tie_break=None) -> List[int]:
+    if NUMPY_AVAILABLE:
+        weight_array = np.asarray(weights, dtype=np.float64)
+        if tie_break is None:
+            return np.argsort(weight_array, kind='stable').tolist()
+        return np.lexsort((np.asarray(tie_break), weight_array)).tolist()
+    
+    if tie_break is None:
+        return sorted(range(len(weights)), key=weights.__getitem__)
+    return sorted(range(len(weights)), key=lambda e: (weights[e], tie_break[e]))
+
+
+def _kruskal_indexed(n: int, sources, targets, weights,
+                     order: List[int]) -> Tuple[List[Tuple[int, int, float]], float]:
+    parent = list(range(n))
+    rank = bytearray(n)
+    mst_edges = []
+    total_weight = 0.0
+    
+    for edge in order:
+        if len(mst_edges) == n - 1:
+            break
+        
+        root_x = sources[edge]
+        while parent[root_x] != root_x:
+            parent[root_x] = parent[parent[root_x]]
+            root_x = parent[root_x]
+        root_y = targets[edge]
+        while parent[root_y] != root_y:
+            parent[root_y] = parent[parent[root_y]]
+            root_y = parent[root_y]
+        
+        if root_x == root_y:
+            continue
+        
+        if rank[root_x] < rank[root_y]:
+            parent[root_x] = root_y
+        elif rank[root_x] > rank[root_y]:
+            parent[root_y] = root_x
+        else:
+            parent[root_y] = root_x
+            rank[root_x] += 1
+        
+        mst_edges.append((sources[edge], targets[edge], weights[edge]))
+        total_weight += weights[edge]
+    
+    return mst_edges, total_weight
+
+
+class IndexedHeap:
+    
+    def __init__(self, capacity: int):
+        self.heap: List[int] = []
+        self.keys: List[float] = [float('inf')] * capacity
+        self.position: List[int] = [-1] * capacity
+    
+    def __len__(self) -> int:
+        return len(self.heap)
+    
+    def __contains__(self, item: int) -> bool:
+        return self.position[item] >= 0
+    
+    def push_or_decrease(self, item: int, key: float) -> bool:
+        if self.position[item] >= 0:
+            if key >= self.keys[item]:
+                return False
+            self.keys[item] = key
+            self._sift_up(self.position[item])
+            return True
+        
+        self.keys[item] = key
+        self.position[item] = len(self.heap)
+        self.heap.append(item)
+        self._sift_up(len(self.heap) - 1)
+        return True
+    
+    def pop(self) -> Tuple[float, int]:
+        heap, position = self.heap, self.position
+        top = heap[0]
+        last = heap.pop()
+        position[top] = -2
+        if heap:
+            heap[0] = last
+            position[last] = 0
+            self._sift_down(0)
+        return self.keys[top], top
+    
+    def _sift_up(self, index: int):
+        heap, keys, position = self.heap, self.keys, self.position
+        item = heap[index]
+        key = keys[item]
+        while index > 0:
+            parent = (index - 1) >> 1
+            parent_item = heap[parent]
+            if keys[parent_item] <= key:
+                break
+            heap[index] = parent_item
+            position[parent_item] = index
+            index = parent
+        heap[index] = item
+        position[item] = index
+    
+    def _sift_down(self, index: int):
+        heap, keys, position = self.heap, self.keys, self.position
+        size = len(heap)
+        item = heap[index]
+        key = keys[item]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and keys[heap[child + 1]] < keys[heap[child]]:
+                child += 1
+            child_item = heap[child]
+            if keys[child_item] >= key:
+                break
+            heap[index] = child_item
+            position[child_item] = index
+            index = child
+        heap[index] = item
+        position[item] = index
+
+
+def coordinate_heuristic(coordinates: Dict[str, Tuple[float, float]],
+                         speed: float = 1.0) -> Callable[[str, str], float]:
+    def estimate(station: str, target: str) -> float:
+        if station not in coordinates or target not in coordinates:
+            return 0.0
+        x1, y1 = coordinates[station]
+        x2, y2 = coordinates[target]
+        return ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5 / speed
+    
+    return estimate
+
+
+class ReachabilityIndex:
+    
+    def __init__(self, adjacency: List[List[Tuple[int, float]]]):
+        n = len(adjacency)
+        self.component = [-1] * n
+        self.parent: List[int] = []
+        self.reach: List[int] = []
+        self.predecessors: List[List[int]] = []
+        
+        order = [-1] * n
+        low = [0] * n
+        on_stack = bytearray(n)
+        stack: List[int] = []
+        counter = 0
+        
+        for root in range(n):
+            if order[root] != -1:
+                continue
+            
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            work = [(root, 0)]
+            
+            while work:
+                node, position = work[-1]
+                edges = adjacency[node]
+                if position < len(edges):
+                    work[-1] = (node, position + 1)
+                    neighbor = edges[position][0]
+                    if order[neighbor] == -1:
+                        order[neighbor] = low[neighbor] = counter
+                        counter += 1
+                        stack.append(neighbor)
+                        on_stack[neighbor] = 1
+                        work.append((neighbor, 0))
+                    elif on_stack[neighbor] and order[neighbor] < low[node]:
+                        low[node] = order[neighbor]
+                    continue
+                
+                work.pop()
+                if work and low[node] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[node]
+                if low[node] == order[node]:
+                    self._close_component(adjacency, stack, on_stack, node)
+        
+        component = self.component
+        self.predecessors = [[] for _ in self.parent]
+        for node in range(n):
+            for neighbor, _ in adjacency[node]:
+                if component[neighbor] != component[node]:
+                    self.predecessors[component[neighbor]].append(component[node])
+    
+    def _close_component(self, adjacency: List[List[Tuple[int, float]]], stack: List[int],
+                         on_stack: bytearray, node: int):
+        component = len(self.parent)
+        members = []
+        while True:
+            member = stack.pop()
+            on_stack[member] = 0
+            self.component[member] = component
+            members.append(member)
+            if member == node:
+                break
+        
+        reach = 1 << component
+        for member in members:
+            for neighbor, _ in adjacency[member]:
+                other = self.component[neighbor]
+                if other != component:
+                    reach |= self.reach[other]
+        
+        self.parent.append(component)
+        self.reach.append(reach)
+    
+    def find(self, component: int) -> int:
+        parent = self.parent
+        while parent[component] != component:
+            parent[component] = parent[parent[component]]
+            component = parent[component]
+        return component
+    
+    def component_of(self, station: int) -> int:
+        return self.find(self.component[station])
+    
+    def add_station(self):
+        component = len(self.parent)
+        self.component.append(component)
+        self.parent.append(component)
+        self.reach.append(1 << component)
+        self.predecessors.append([])
+    
+    def add_route(self, from_station: int, to_station: int):
+        source = self.component_of(from_station)
+        target = self.component_of(to_station)
+        if self.reach[source] >> target & 1:
+            return
+        
+        reach = self.reach
+        target_reach = reach[target]
+        self.predecessors[target].append(source)
+        visited = {source}
+        stack = [source]
+        while stack:
+            component = stack.pop()
+            reach[component] |= target_reach
+            for predecessor in self.predecessors[component]:
+                predecessor = self.find(predecessor)
+                if predecessor not in visited and not reach[predecessor] >> target & 1:
+                    visited.add(predecessor)
+                    stack.append(predecessor)
+        
+        if target_reach >> source & 1:
+            visited.add(target)
+            for component in visited:
+                if component != source and target_reach >> component & 1:
+                    self.parent[component] = source
+                    self.predecessors[source].extend(self.predecessors[component])
+    
+    def reachable(self, from_station: int, to_station: int) -> bool:
+        return bool(self.reach[self.component_of(from_station)] >> self.component_of(to_station) & 1)
+
+
+_BINARY_MAGIC = b"TGCSR\x01" + (b"<" if sys.byteorder == "little" else b">") + b"\x00"
+_BINARY_HEADER = struct.Struct("<8sqqq")
+
+
+class CompactGraph:
+    
+    def __init__(self, offsets: array, targets: array, weights: array, edge_ids: array):
+        self.n = len(offsets) - 1
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.edge_ids = edge_ids
+    
+    @classmethod
+    def from_edges(cls, n: int, edges: List[Tuple[int, int, float]]) -> "CompactGraph":
+        counts = [0] * (n + 1)
+        for u, _, _ in edges:
+            counts[u + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        
+        offsets = array('i', counts)
+        position = counts[:n]
+        targets = array('i', bytes(4 * len(edges)))
+        weights = array('d', bytes(8 * len(edges)))
+        edge_ids = array('i', bytes(4 * len(edges)))
+        
+        for edge_id, (u, v, weight) in enumerate(edges):
+            slot = position[u]
+            position[u] += 1
+            targets[slot] = v
+            weights[slot] = weight
+            edge_ids[slot] = edge_id
+        
+        return cls(offsets, targets, weights, edge_ids)
+    
+    @classmethod
+    def from_transport_graph(cls, graph: "TransportGraph") -> "CompactGraph":
+        index = graph.station_index
+        return cls.from_edges(len(index), [(index[f], index[t], w) for f, t, w in graph.edges])
+    
+    def save(self, filename: str, stations: List[str]):
+        names = json.dumps(stations, ensure_ascii=False).encode('utf-8')
+        with open(filename, 'wb') as f:
+            f.write(_BINARY_HEADER.pack(_BINARY_MAGIC, self.n, len(self.targets), len(names)))
+            for values in (self.weights, self.offsets, self.targets, self.edge_ids):
+                f.write(values)
+            f.write(names)
+    
+    @classmethod
+    def load(cls, filename: str) -> Tuple["CompactGraph", List[str]]:
+        with open(filename, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        view = memoryview(buffer)
+        magic, n, m, names_size = _BINARY_HEADER.unpack_from(view)
+        if magic != _BINARY_MAGIC:
+            raise ValueError(f"{filename}: не файл графа или другой порядок байтов")
+        
+        position = _BINARY_HEADER.size
+        sections = []
+        for typecode, count in (('d', m), ('i', n + 1), ('i', m), ('i', m)):
+            size = count * array(typecode).itemsize
+            sections.append(view[position:position + size].cast(typecode))
+            position += size
+        stations = json.loads(bytes(view[position:position + names_size]).decode('utf-8'))
+        
+        weights, offsets, targets, edge_ids = sections
+        return cls(offsets, targets, weights, edge_ids), stations
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in ('offsets', 'targets', 'weights', 'edge_ids'):
+            if isinstance(state[name], memoryview):
+                state[name] = array(state[name].format, state[name].tobytes())
+        return state
+    
+    def sources(self) -> array:
+        result = array('i', bytes(4 * len(self.targets)))
+        offsets = self.offsets
+        for u in range(self.n):
+            for slot in range(offsets[u], offsets[u + 1]):
+                result[slot] = u
+        return result
+    
+    def dijkstra(self, source: int) -> List[float]:
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        distances = [float('inf')] * self.n
+        distances[source] = 0.0
+        visited = bytearray(self.n)
+        heap = [(0.0, source)]
+        
+        while heap:
+            current_dist, current = heapq.heappop(heap)
+            
+            if visited[current]:
+                continue
+            
+            visited[current] = 1
+            
+            for slot in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[slot]
+                if visited[neighbor]:
+                    continue
+                
+                new_dist = current_dist + weights[slot]
+                
+                if new_dist < distances[neighbor]:
+                    distances[neighbor] = new_dist
+                    heapq.heappush(heap, (new_dist, neighbor))
+        
+        return distances
+    
+    def dijkstra_indexed_heap(self, source: int) -> List[float]:
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        heap = IndexedHeap(self.n)
+        distances = heap.keys
+        heap.push_or_decrease(source, 0.0)
+        
+        while heap:
+            current_dist, current = heap.pop()
+            
+            for slot in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[slot]
+                if heap.position[neighbor] != -2:
+                    heap.push_or_decrease(neighbor, current_dist + weights[slot])
+        
+        return list(distances)
+    
+    def bellman_ford(self, source: int) -> Tuple[List[float], bool]:
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        inf = float('inf')
+        distances = [inf] * self.n
+        distances[source] = 0.0
+        
+        for _ in range(self.n - 1):
+            changed = False
+            for u in range(self.n):
+                du = distances[u]
+                if du == inf:
+                    continue
+                for slot in range(offsets[u], offsets[u + 1]):
+                    new_dist = du + weights[slot]
+                    if new_dist < distances[targets[slot]]:
+                        distances[targets[slot]] = new_dist
+                        changed = True
+            
+            if not changed:
+                return distances, False
+        
+        for u in range(self.n):
+            du = distances[u]
+            if du == inf:
+                continue
+            for slot in range(offsets[u], offsets[u + 1]):
+                if du + weights[slot] < distances[targets[slot]]:
+                    return distances, True
+        
+        return distances, False
+    
+    def floyd_warshall(self) -> List[List[float]]:
+        n = self.n
+        inf = float('inf')
+        dist = [[inf] * n for _ in range(n)]
+        
+        for i in range(n):
+            dist[i][i] = 0.0
+        
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        for u in range(n):
+            row = dist[u]
+            for slot in range(offsets[u], offsets[u + 1]):
+                v = targets[slot]
+                if weights[slot] < row[v]:
+                    row[v] = weights[slot]
+        
+        for k in range(n):
+            row_k = dist[k]
+            for i in range(n):
+                row_i = dist[i]
+                d_ik = row_i[k]
+                if d_ik == inf:
+                    continue
+                for j in range(n):
+                    candidate = d_ik + row_k[j]
+                    if candidate < row_i[j]:
+                        row_i[j] = candidate
+        
+        return dist
+    
+    def kruskal(self) -> Tuple[List[Tuple[int, int, float]], float]:
+        order = _weight_order(self.weights, self.edge_ids)
+        return _kruskal_indexed(self.n, self.sources(), self.targets, self.weights, order)
+    
+    def prim(self, start: int) -> Tuple[List[Tuple[int, int, float]], float]:
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        visited = bytearray(self.n)
+        visited[start] = 1
+        visited_count = 1
+        mst_edges = []
+        total_weight = 0.0
+        edges_heap = [(weights[slot], start, targets[slot])
+                      for slot in range(offsets[start], offsets[start + 1])]
+        heapq.heapify(edges_heap)
+        
+        while visited_count < self.n and edges_heap:
+            weight, from_station, to_station = heapq.heappop(edges_heap)
+            
+            if visited[to_station]:
+                continue
+            
+            visited[to_station] = 1
+            visited_count += 1
+            mst_edges.append((from_station, to_station, weight))
+            total_weight += weight
+            
+            for slot in range(offsets[to_station], offsets[to_station + 1]):
+                if not visited[targets[slot]]:
+                    heapq.heappush(edges_heap, (weights[slot], to_station, targets[slot]))
+        
+        return mst_edges, total_weight
+    
+    def prim_indexed_heap(self, start: int) -> Tuple[List[Tuple[int, int, float]], float]:
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        heap = IndexedHeap(self.n)
+        best_from = [-1] * self.n
+        heap.push_or_decrease(start, 0.0)
+        mst_edges = []
+        total_weight = 0.0
+        
+        while heap:
+            weight, current = heap.pop()
+            if current != start:
+                mst_edges.append((best_from[current], current, weight))
+                total_weight += weight
+            
+            for slot in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[slot]
+                if heap.position[neighbor] != -2 and heap.push_or_decrease(neighbor, weights[slot]):
+                    best_from[neighbor] = current
+        
+        return mst_edges, total_weight
+
+
+BACKENDS: Dict[str, Optional[Callable[["TransportGraph"], CompactGraph]]] = {
+    "python": None,
+    "compact": CompactGraph.from_transport_graph,
+}
+
+
+def register_backend(name: str, factory: Callable[["TransportGraph"], CompactGraph]):
+    BACKENDS[name] = factory
+
+
+def _read_routes(filename: str, delimiter: Optional[str], skip_header: bool) -> Iterator[Tuple[str, str, float]]:
+    with open(filename, newline='', encoding='utf-8') as f:
+        rows = csv.reader(f, delimiter=delimiter) if delimiter is not None else (line.split() for line in f)
+        if skip_header:
+            next(rows, None)
+        for line_number, row in enumerate(rows, 2 if skip_header else 1):
+            if not row or row[0].startswith('#'):
+                continue
+            if len(row) < 3:
+                raise ValueError(f"{filename}:{line_number}: ожидается «откуда, куда, вес»")
+            yield row[0], row[1], float(row[2])
+
+
+class TransportGraph:
+    
+    def __init__(self, backend: str = "python", cache_size: int = 0):
+        if backend not in BACKENDS:
+            raise ValueError(f"Неизвестный движок: {backend}. Доступны: {', '.join(BACKENDS)}")
+        
+        self.stations: Set[str] = set()
+        self._graph: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
+        self._reverse_graph: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
+        self._edges: List[Tuple[str, str, float]] = []
+        self._pending_binary: Optional[Tuple[CompactGraph, List[str]]] = None
+        self.station_index: Dict[str, int] = {}
+        self.index_station: Dict[int, str] = {}
+        self.backend = backend
+        self.frozen = False
+        self.compact: Optional[CompactGraph] = None
+        self.version = 0
+        self.cache_size = cache_size
+        self._dijkstra_cache: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+        self._dijkstra_cache_version = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.reachability: Optional[ReachabilityIndex] = None
+    
+    @property
+    def graph(self) -> Dict[str, List[Tuple[str, float]]]:
+        self._ensure_adjacency()
+        return self._graph
+    
+    @property
+    def reverse_graph(self) -> Dict[str, List[Tuple[str, float]]]:
+        self._ensure_adjacency()
+        return self._reverse_graph
+    
+    @property
+    def edges(self) -> List[Tuple[str, str, float]]:
+        self._ensure_adjacency()
+        return self._edges
+    
+    def freeze(self) -> CompactGraph:
+        if self.compact is None:
+            factory = BACKENDS[self.backend] or CompactGraph.from_transport_graph
+            self.compact = factory(self)
+        self.frozen = True
+        return self.compact
+    
+    def unfreeze(self):
+        self.frozen = False
+        self.compact = None
+    
+    def _engine(self) -> Optional[CompactGraph]:
+        if self.compact is None and BACKENDS[self.backend] is not None:
+            self.compact = BACKENDS[self.backend](self)
+        return self.compact
+    
+    def _before_change(self):
+        if self.frozen:
+            raise RuntimeError("Граф заморожен (freeze). Вызовите unfreeze() перед изменением.")
+        self.compact = None
+        self.version += 1
+    
+    def add_station(self, name: str):
+        if name not in self.station_index:
+            self._before_change()
+        self.stations.add(name)
+        if name not in self.station_index:
+            idx = len(self.station_index)
+            self.station_index[name] = idx
+            self.index_station[idx] = name
+            if self.reachability is not None:
+                self.reachability.add_station()
+    
+    def add_route(self, from_station: str, to_station: str, weight: float):
+        self._before_change()
+        self.add_station(from_station)
+        self.add_station(to_station)
+        self.graph[from_station].append((to_station, weight))
+        self.reverse_graph[to_station].append((from_station, weight))
+        self.edges.append((from_station, to_station, weight))
+        if self.reachability is not None:
+            self.reachability.add_route(self.station_index[from_station], self.station_index[to_station])
+    
+    def add_routes(self, routes: Iterable[Tuple[str, str, float]]) -> int:
+        self._before_change()
+        self.reachability = None
+        stations = self.stations
+        station_index = self.station_index
+        index_station = self.index_station
+        graph = self.graph
+        reverse_graph = self.reverse_graph
+        append_edge = self.edges.append
+        count = 0
+        
+        for from_station, to_station, weight in routes:
+            if from_station not in station_index:
+                idx = len(station_index)
+                station_index[from_station] = idx
+                index_station[idx] = from_station
+                stations.add(from_station)
+            if to_station not in station_index:
+                idx = len(station_index)
+                station_index[to_station] = idx
+                index_station[idx] = to_station
+                stations.add(to_station)
+            graph[from_station].append((to_station, weight))
+            reverse_graph[to_station].append((from_station, weight))
+            append_edge((from_station, to_station, weight))
+            count += 1
+        
+        return count
+    
+    def add_routes_from_file(self, filename: str, delimiter: Optional[str] = ",",
+                             skip_header: bool = False) -> int:
+        return self.add_routes(_read_routes(filename, delimiter, skip_header))
+    
+    def add_routes_from_arrays(self, from_stations, to_stations, weights) -> int:
+        columns = [column.tolist() if hasattr(column, "tolist") else column
+                   for column in (from_stations, to_stations, weights)]
+        if not len(columns[0]) == len(columns[1]) == len(columns[2]):
+            raise ValueError("Массивы станций и весов должны быть одной длины")
+        return self.add_routes(zip(*columns))
+    
+    def save_binary(self, filename: str):
+        compact = self.compact if isinstance(self.compact, CompactGraph) else CompactGraph.from_transport_graph(self)
+        compact.save(filename, [self.index_station[i] for i in range(len(self.index_station))])
+    
+    @classmethod
+    def load_binary(cls, filename: str, backend: str = "compact") -> "TransportGraph":
+        compact, names = CompactGraph.load(filename)
+        graph = cls(backend)
+        graph.stations = set(names)
+        graph.station_index = {name: idx for idx, name in enumerate(names)}
+        graph.index_station = dict(enumerate(names))
+        if backend == "compact":
+            graph.compact = compact
+        graph._pending_binary = (compact, names)
+        return graph
+    
+    def _ensure_adjacency(self):
+        if self._pending_binary is None:
+            return
+        
+        compact, names = self._pending_binary
+        self._pending_binary = None
+        offsets = compact.offsets.tolist()
+        targets = compact.targets.tolist()
+        weights = compact.weights.tolist()
+        slot_of_edge = [0] * len(targets)
+        for slot, edge_id in enumerate(compact.edge_ids.tolist()):
+            slot_of_edge[edge_id] = slot
+        sources = [names[u] for u in range(len(names)) for _ in range(offsets[u + 1] - offsets[u])]
+        
+        self._edges = [(sources[slot], names[targets[slot]], weights[slot]) for slot in slot_of_edge]
+        graph = self._graph
+        reverse_graph = self._reverse_graph
+        for from_station, to_station, weight in self._edges:
+            graph[from_station].append((to_station, weight))
+            reverse_graph[to_station].append((from_station, weight))
+    
+    def remove_route(self, from_station: str, to_station: str) -> bool:
+        if not any(neighbor == to_station for neighbor, _ in self.graph.get(from_station, [])):
+            return False
+        
+        self._before_change()
+        self.graph[from_station] = [(n, w) for n, w in self.graph[from_station] if n != to_station]
+        self.reverse_graph[to_station] = [(n, w) for n, w in self.reverse_graph[to_station]
+                                          if n != from_station]
+        self._edges = [(f, t, w) for f, t, w in self._edges if f != from_station or t != to_station]
+        self.reachability = None
+        return True
+    
+    def update_route(self, from_station: str, to_station: str, weight: float):
+        reachability = self.reachability
+        existed = self.remove_route(from_station, to_station)
+        self.add_route(from_station, to_station, weight)
+        if existed:
+            self.reachability = reachability
+    
+    def build_reachability_index(self) -> ReachabilityIndex:
+        self.reachability = ReachabilityIndex(self._indexed_adjacency())
+        return self.reachability
+    
+    def reachable(self, from_station: str, to_station: str) -> bool:
+        if from_station not in self.station_index or to_station not in self.station_index:
+            return False
+        
+        index = self.reachability or self.build_reachability_index()
+        return index.reachable(self.station_index[from_station], self.station_index[to_station])
+    
+    def component_id(self, station: str) -> Optional[int]:
+        if station not in self.station_index:
+            return None
+        
+        index = self.reachability or self.build_reachability_index()
+        return index.component_of(self.station_index[station])
+    
+    def strongly_connected_components(self) -> Dict[int, List[str]]:
+        index = self.reachability or self.build_reachability_index()
+        components: Dict[int, List[str]] = defaultdict(list)
+        for station, idx in self.station_index.items():
+            components[index.component_of(idx)].append(station)
+        return dict(components)
+    
+    def get_route_weight(self, from_station: str, to_station: str) -> float:
+        return min((w for n, w in self.graph.get(from_station, []) if n == to_station),
+                   default=float('inf'))
+    
+    def _names_to_values(self, values: List[float]) -> Dict[str, float]:
+        return {self.index_station[i]: value for i, value in enumerate(values)}
+    
+    def _indices_to_edges(self, edges: List[Tuple[int, int, float]]) -> List[Tuple[str, str, float]]:
+        names = self.index_station
+        return [(names[u], names[v], weight) for u, v, weight in edges]
+    
+    def shortest_path_Dijkstra(self, start: str, indexed_heap: bool = False) -> Dict[str, float]:
+        if self.cache_size <= 0 or start not in self.stations:
+            return self._shortest_path_Dijkstra(start, indexed_heap)
+        
+        cache = self._dijkstra_cache
+        if self._dijkstra_cache_version != self.version:
+            cache.clear()
+            self._dijkstra_cache_version = self.version
+        
+        distances = cache.get(start)
+        if distances is not None:
+            cache.move_to_end(start)
+            self.cache_hits += 1
+            return dict(distances)
+        
+        self.cache_misses += 1
+        distances = self._shortest_path_Dijkstra(start, indexed_heap)
+        cache[start] = distances
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return dict(distances)
+    
+    def cache_stats(self) -> Dict[str, float]:
+        requests = self.cache_hits + self.cache_misses
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / requests if requests else 0.0,
+            "size": len(self._dijkstra_cache) if self._dijkstra_cache_version == self.version else 0,
+            "capacity": self.cache_size,
+        }
+    
+    def clear_cache(self):
+        self._dijkstra_cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    def _shortest_path_Dijkstra(self, start: str, indexed_heap: bool = False) -> Dict[str, float]:
+        if start not in self.stations:
+            return {}
+        
+        engine = self._engine()
+        if engine is not None:
+            if indexed_heap:
+                return self._names_to_values(engine.dijkstra_indexed_heap(self.station_index[start]))
+            return self._names_to_values(engine.dijkstra(self.station_index[start]))
+        
+        if indexed_heap:
+            return self._dijkstra_indexed_heap(start)
+        
+        distances = {station: float('inf') for station in self.stations}
+        distances[start] = 0.0
+        visited = set()
+        heap = [(0.0, start)]
+        
+        adjacency = self.graph
+        while heap:
+            current_dist, current = heapq.heappop(heap)
+            
+            if current in visited:
+                continue
+            
+            visited.add(current)
+            
+            for neighbor, weight in adjacency[current]:
+                if neighbor in visited:
+                    continue
+                
+                new_dist = current_dist + weight
+                
+                if new_dist < distances[neighbor]:
+                    distances[neighbor] = new_dist
+                    heapq.heappush(heap, (new_dist, neighbor))
+        
+        return distances
+    
+    def _dijkstra_indexed_heap(self, start: str) -> Dict[str, float]:
+        station_index, index_station = self.station_index, self.index_station
+        heap = IndexedHeap(len(station_index))
+        heap.push_or_decrease(station_index[start], 0.0)
+        
+        adjacency = self.graph
+        while heap:
+            current_dist, current = heap.pop()
+            
+            for neighbor, weight in adjacency[index_station[current]]:
+                neighbor_idx = station_index[neighbor]
+                if heap.position[neighbor_idx] != -2:
+                    heap.push_or_decrease(neighbor_idx, current_dist + weight)
+        
+        return self._names_to_values(heap.keys)
+    
+    def shortest_route(self, start: str, target: str,
+                       heuristic: Optional[Callable[[str, str], float]] = None,
+                       bidirectional: bool = False) -> Tuple[List[str], float]:
+        if start not in self.stations or target not in self.stations:
+            return [], float('inf')
+        
+        if start == target:
+            return [start], 0.0
+        
+        if self.reachability is not None and not self.reachability.reachable(
+                self.station_index[start], self.station_index[target]):
+            return [], float('inf')
+        
+        if bidirectional:
+            if heuristic is not None:
+                raise ValueError("Двунаправленный поиск не поддерживает эвристику A*")
+            return self._shortest_route_bidirectional(start, target)
+        
+        distances = {start: 0.0}
+        parent: Dict[str, Optional[str]] = {start: None}
+        estimate = heuristic(start, target) if heuristic else 0.0
+        heap = [(estimate, 0.0, start)]
+        
+        adjacency = self.graph
+        while heap:
+            _, current_dist, current = heapq.heappop(heap)
+            
+            if current_dist > distances[current]:
+                continue
+            
+            if current == target:
+                return self._build_route(parent, target), current_dist
+            
+            for neighbor, weight in adjacency[current]:
+                new_dist = current_dist + weight
+                
+                if new_dist < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = new_dist
+                    parent[neighbor] = current
+                    estimate = heuristic(neighbor, target) if heuristic else 0.0
+                    heapq.heappush(heap, (new_dist + estimate, new_dist, neighbor))
+        
+        return [], float('inf')
+    
+    def _shortest_route_bidirectional(self, start: str, target: str) -> Tuple[List[str], float]:
+        distances = ({start: 0.0}, {target: 0.0})
+        parents: Tuple[Dict[str, Optional[str]], Dict[str, Optional[str]]] = ({start: None}, {target: None})
+        visited: Tuple[Set[str], Set[str]] = (set(), set())
+        heaps = ([(0.0, start)], [(0.0, target)])
+        adjacency = (self.graph, self.reverse_graph)
+        best = float('inf')
+        meeting = None
+        
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+            
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            current_dist, current = heapq.heappop(heaps[side])
+            
+            if current in visited[side]:
+                continue
+            
+            visited[side].add(current)
+            
+            for neighbor, weight in adjacency[side][current]:
+                new_dist = current_dist + weight
+                
+                if new_dist < distances[side].get(neighbor, float('inf')):
+                    distances[side][neighbor] = new_dist
+                    parents[side][neighbor] = current
+                    heapq.heappush(heaps[side], (new_dist, neighbor))
+                
+                if neighbor in distances[1 - side]:
+                    total = distances[side][neighbor] + distances[1 - side][neighbor]
+                    if total < best:
+                        best = total
+                        meeting = neighbor
+        
+        if meeting is None:
+            return [], float('inf')
+        
+        route = self._build_route(parents[0], meeting)
+        current = parents[1][meeting]
+        while current is not None:
+            route.append(current)
+            current = parents[1][current]
+        
+        return route, best
+    
+    @staticmethod
+    def _build_route(parent: Dict[str, Optional[str]], target: str) -> List[str]:
+        route = []
+        current: Optional[str] = target
+        while current is not None:
+            route.append(current)
+            current = parent[current]
+        route.reverse()
+        return route
+    
+    def shortest_path_BellmanFord(self, start: str) -> Tuple[Dict[str, float], bool]:
+        if start not in self.stations:
+            return {}, False
+        
+        engine = self._engine()
+        if engine is not None:
+            distances, has_negative_cycle = engine.bellman_ford(self.station_index[start])
+            return self._names_to_values(distances), has_negative_cycle
+        
+        distances = {station: float('inf') for station in self.stations}
+        distances[start] = 0.0
+        
+        for _ in range(len(self.stations) - 1):
+            changed = False
+            for from_station, to_station, weight in self.edges:
+                if distances[from_station] != float('inf'):
+                    new_dist = distances[from_station] + weight
+                    if new_dist < distances[to_station]:
+                        distances[to_station] = new_dist
+                        changed = True
+            
+            if not changed:
+                return distances, False
+        
+        has_negative_cycle = False
+        for from_station, to_station, weight in self.edges:
+            if distances[from_station] != float('inf'):
+                if distances[from_station] + weight < distances[to_station]:
+                    has_negative_cycle = True
+                    break
+        
+        return distances, has_negative_cycle
+    
+    def shortest_path_SPFA(self, start: str) -> Tuple[Dict[str, float], Optional[List[str]]]:
+        if start not in self.stations:
+            return {}, None
+        
+        n = len(self.stations)
+        distances = {station: float('inf') for station in self.stations}
+        distances[start] = 0.0
+        parent: Dict[str, Optional[str]] = {start: None}
+        path_length = {start: 0}
+        queue = deque([start])
+        in_queue = {start}
+        
+        adjacency = self.graph
+        while queue:
+            current = queue.popleft()
+            in_queue.discard(current)
+            current_dist = distances[current]
+            
+            for neighbor, weight in adjacency[current]:
+                new_dist = current_dist + weight
+                if new_dist < distances[neighbor]:
+                    distances[neighbor] = new_dist
+                    parent[neighbor] = current
+                    path_length[neighbor] = path_length[current] + 1
+                    
+                    if path_length[neighbor] >= n:
+                        cycle = self._extract_cycle(parent, neighbor)
+                        if cycle is not None:
+                            return distances, cycle
+                    
+                    if neighbor not in in_queue:
+                        in_queue.add(neighbor)
+                        queue.append(neighbor)
+        
+        return distances, None
+    
+    @staticmethod
+    def _extract_cycle(parent: Dict[str, Optional[str]], station: str) -> Optional[List[str]]:
+        walk_of: Dict[str, int] = {}
+        
+        for walk, root in enumerate([station] + list(parent)):
+            current: Optional[str] = root
+            while current is not None and current not in walk_of:
+                walk_of[current] = walk
+                current = parent.get(current)
+            
+            if current is None or walk_of[current] != walk:
+                continue
+            
+            cycle = [current]
+            node = parent[current]
+            while node != current:
+                cycle.append(node)
+                node = parent[node]
+            cycle.append(current)
+            cycle.reverse()
+            return cycle
+        
+        return None
+    
+    def all_pairs_shortest_paths_FloydWarshall(self) -> List[List[float]]:
+        n = len(self.stations)
+        if n == 0:
+            return []
+        
+        engine = self._engine()
+        if engine is not None:
+            return engine.floyd_warshall()
+        
+        dist = [[float('inf') for _ in range(n)] for _ in range(n)]
+        
+        for i in range(n):
+            dist[i][i] = 0.0
+        
+        for from_station, to_station, weight in self.edges:
+            from_idx = self.station_index[from_station]
+            to_idx = self.station_index[to_station]
+            if weight < dist[from_idx][to_idx]:
+                dist[from_idx][to_idx] = weight
+        
+        for k in range(n):
+            for i in range(n):
+                for j in range(n):
+                    if dist[i][k] != float('inf') and dist[k][j] != float('inf'):
+                        if dist[i][j] > dist[i][k] + dist[k][j]:
+                            dist[i][j] = dist[i][k] + dist[k][j]
+        
+        return dist
+    
+    def all_pairs_shortest_paths_FloydWarshall_numpy(self, block_size: Optional[int] = None,
+                                                     return_predecessors: bool = False,
+                                                     return_next_hop: bool = False,
+                                                     dtype: str = "float64",
+                                                     memmap_dir: Optional[str] = None
+                                                     ) -> Union["np.ndarray", Tuple["np.ndarray", ...]]:
+        _require_numpy()
+        
+        n = len(self.stations)
+        
+        def allocate(name: str, matrix_dtype) -> "np.ndarray":
+            if memmap_dir is None:
+                return np.empty((n, n), dtype=matrix_dtype)
+            return np.lib.format.open_memmap(os.path.join(memmap_dir, f"{name}.npy"), mode='w+',
+                                             dtype=matrix_dtype, shape=(n, n))
+        
+        dist = allocate("distances", np.dtype(dtype))
+        dist.fill(np.inf)
+        
+        if self.edges:
+            from_idx = np.fromiter((self.station_index[f] for f, _, _ in self.edges),
+                                   dtype=np.intp, count=len(self.edges))
+            to_idx = np.fromiter((self.station_index[t] for _, t, _ in self.edges),
+                                 dtype=np.intp, count=len(self.edges))
+            weights = np.fromiter((w for _, _, w in self.edges),
+                                  dtype=dist.dtype, count=len(self.edges))
+            np.minimum.at(dist, (from_idx, to_idx), weights)
+        
+        diagonal = np.arange(n)
+        dist[diagonal, diagonal] = np.minimum(dist[diagonal, diagonal], 0.0)
+        
+        pred = None
+        if return_predecessors:
+            pred = allocate("predecessors", np.int32)
+            pred[...] = np.where(np.isfinite(dist), diagonal[:, None], -1)
+            pred[diagonal, diagonal] = diagonal
+        
+        next_hop = None
+        if return_next_hop:
+            next_hop = allocate("next_hop", np.int32)
+            next_hop[...] = np.where(np.isfinite(dist), diagonal[None, :], -1)
+            next_hop[diagonal, diagonal] = diagonal
+        
+        if block_size is None or block_size >= n:
+            for k in range(n):
+                candidate = dist[:, k, None] + dist[None, k, :]
+                if pred is not None or next_hop is not None:
+                    improved = candidate < dist
+                    if pred is not None:
+                        np.copyto(pred, pred[k].copy()[None, :], where=improved)
+                    if next_hop is not None:
+                        np.copyto(next_hop, next_hop[:, k].copy()[:, None], where=improved)
+                np.minimum(dist, candidate, out=dist)
+        else:
+            buffer = np.empty((block_size, n), dtype=dist.dtype)
+            for k in range(n):
+                row_k = dist[k].copy()
+                pred_k = pred[k].copy() if pred is not None else None
+                for start in range(0, n, block_size):
+                    stop = min(start + block_size, n)
+                    block = dist[start:stop]
+                    candidate = buffer[:stop - start]
+                    np.add(block[:, k, None], row_k[None, :], out=candidate)
+                    if pred is not None or next_hop is not None:
+                        improved = candidate < block
+                        if pred is not None:
+                            pred[start:stop][improved] = np.broadcast_to(pred_k, block.shape)[improved]
+                        if next_hop is not None:
+                            np.copyto(next_hop[start:stop], next_hop[start:stop, k].copy()[:, None],
+                                      where=improved)
+                    np.minimum(block, candidate, out=block)
+        
+        if pred is None and next_hop is None:
+            return dist
+        return (dist,) + tuple(matrix for matrix in (pred, next_hop) if matrix is not None)
+    
+    def reconstruct_path(self, next_hop, start: str, target: str) -> List[str]:
+        if start not in self.station_index or target not in self.station_index:
+            return []
+        
+        current = self.station_index[start]
+        destination = self.station_index[target]
+        if next_hop[current][destination] == -1:
+            return []
+        
+        route = [start]
+        while current != destination:
+            current = int(next_hop[current][destination])
+            route.append(self.index_station[current])
+            if len(route) > len(self.station_index):
+                raise ValueError("Путь проходит через отрицательный цикл")
+        return route
+    
+    def _indexed_adjacency(self) -> List[List[Tuple[int, float]]]:
+        adjacency: List[List[Tuple[int, float]]] = [[] for _ in range(len(self.station_index))]
+        for from_station, to_station, weight in self.edges:
+            adjacency[self.station_index[from_station]].append((self.station_index[to_station], weight))
+        return adjacency
+    
+    def _johnson_potentials(self) -> List[float]:
+        source = "__johnson_source__"
+        while source in self.stations:
+            source = "_" + source
+        
+        helper = TransportGraph(self.backend)
+        for station in self.station_index:
+            helper.add_route(source, station, 0.0)
+        for from_station, to_station, weight in self.edges:
+            helper.add_route(from_station, to_station, weight)
+        
+        distances, has_negative_cycle = helper.shortest_path_BellmanFord(source)
+        if has_negative_cycle:
+            raise ValueError("Граф содержит отрицательный цикл. Кратчайшие пути не определены.")
+        
+        return [distances[self.index_station[i]] for i in range(len(self.station_index))]
+    
+    def _reweighted_adjacency(self) -> Tuple[List[List[Tuple[int, float]]], Optional[List[float]]]:
+        adjacency = self._indexed_adjacency()
+        if not any(weight < 0 for _, _, weight in self.edges):
+            return adjacency, None
+        
+        potentials = self._johnson_potentials()
+        adjacency = [
+            [(v, max(0.0, weight + potentials[u] - potentials[v])) for v, weight in neighbors]
+            for u, neighbors in enumerate(adjacency)
+        ]
+        return adjacency, potentials
+    
+    def all_pairs_shortest_paths_Johnson(self, processes: Optional[int] = None,
+                                         chunksize: int = 16) -> List[List[float]]:
+        n = len(self.stations)
+        if n == 0:
+            return []
+        
+        adjacency, potentials = self._reweighted_adjacency()
+        
+        workers = processes or os.cpu_count() or 1
+        if workers == 1 or n < 2 * chunksize:
+            dist = [_dijkstra_indexed(adjacency, source) for source in range(n)]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_dijkstra_worker,
+                                     initargs=(adjacency,)) as executor:
+                dist = list(executor.map(_dijkstra_worker, range(n), chunksize=chunksize))
+        
+        if potentials is not None:
+            for u in range(n):
+                row = dist[u]
+                for v in range(n):
+                    if row[v] != float('inf'):
+                        row[v] = row[v] - potentials[u] + potentials[v]
+        
+        return dist
+    
+    def distance_matrix(self, sources: List[str], targets: List[str],
+                        processes: Optional[int] = None, chunksize: int = 4) -> "np.ndarray":
+        _require_numpy()
+        
+        matrix = np.full((len(sources), len(targets)), np.inf, dtype=np.float64)
+        known_sources = [(row, self.station_index[name]) for row, name in enumerate(sources)
+                         if name in self.station_index]
+        known_targets = [(col, self.station_index[name]) for col, name in enumerate(targets)
+                         if name in self.station_index]
+        if not known_sources or not known_targets:
+            return matrix
+        
+        adjacency, potentials = self._reweighted_adjacency()
+        target_indices = [index for _, index in known_targets]
+        source_indices = [index for _, index in known_sources]
+        if self.reachability is not None:
+            reachable = [[target for target in target_indices if self.reachability.reachable(source, target)]
+                         for source in source_indices]
+        else:
+            reachable = [None] * len(source_indices)
+        
+        workers = processes or os.cpu_count() or 1
+        if workers == 1 or len(source_indices) < 2 * chunksize:
+            rows = [_dijkstra_to_targets(adjacency, source, target_indices, subset)
+                    for source, subset in zip(source_indices, reachable)]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_dijkstra_worker,
+                                     initargs=(adjacency, target_indices)) as executor:
+                rows = list(executor.map(_dijkstra_targets_worker, source_indices, reachable,
+                                         chunksize=chunksize))
+        
+        if potentials is not None:
+            rows = [[distance - potentials[source] + potentials[target] for distance, target in zip(row, target_indices)]
+                    for source, row in zip(source_indices, rows)]
+        
+        row_positions = np.array([row for row, _ in known_sources], dtype=np.intp)
+        col_positions = np.array([col for col, _ in known_targets], dtype=np.intp)
+        matrix[np.ix_(row_positions, col_positions)] = np.array(rows, dtype=np.float64)
+        return matrix
+    
+    def get_station_name(self, index: int) -> str:
+        return self.index_station.get(index, "")
+    
+    def get_all_stations(self) -> List[str]:
+        return sorted(list(self.stations))
+
+
+class DynamicShortestPaths:
+    
+    def __init__(self, graph: TransportGraph):
+        self.graph = graph
+        self.trees: Dict[str, Tuple[Dict[str, float], Dict[str, Optional[str]], Dict[str, Set[str]]]] = {}
+        self.all_pairs: Optional[List[List[float]]] = None
+        self.version = graph.version
+    
+    def track_source(self, start: str) -> Dict[str, float]:
+        if start not in self.graph.stations:
+            return {}
+        
+        self._sync()
+        if start not in self.trees:
+            self._check_weights()
+            distances = {station: float('inf') for station in self.graph.stations}
+            distances[start] = 0.0
+            parent: Dict[str, Optional[str]] = {station: None for station in self.graph.stations}
+            children: Dict[str, Set[str]] = defaultdict(set)
+            self.trees[start] = (distances, parent, children)
+            self._propagate(start, [(0.0, start)])
+        
+        return self.trees[start][0]
+    
+    def track_all_pairs(self, processes: Optional[int] = 1) -> List[List[float]]:
+        self._sync()
+        if self.all_pairs is None:
+            self._check_weights()
+            self.all_pairs = self.graph.all_pairs_shortest_paths_Johnson(processes=processes)
+        return self.all_pairs
+    
+    def get_distances(self, start: str) -> Dict[str, float]:
+        return self.track_source(start)
+    
+    def update_route(self, from_station: str, to_station: str, weight: float):
+        if weight < 0:
+            raise ValueError("Динамические кратчайшие пути не поддерживают отрицательные веса")
+        
+        self._sync()
+        old_weight = self.graph.get_route_weight(from_station, to_station)
+        self.graph.update_route(from_station, to_station, weight)
+        self.version = self.graph.version
+        self._register_new_stations()
+        
+        if weight < old_weight:
+            self._on_decrease(from_station, to_station, weight)
+        elif weight > old_weight:
+            self._on_increase(from_station, to_station, old_weight)
+    
+    def remove_route(self, from_station: str, to_station: str) -> bool:
+        self._sync()
+        old_weight = self.graph.get_route_weight(from_station, to_station)
+        if not self.graph.remove_route(from_station, to_station):
+            return False
+        
+        self.version = self.graph.version
+        self._on_increase(from_station, to_station, old_weight)
+        return True
+    
+    def _sync(self):
+        if self.version == self.graph.version:
+            return
+        
+        sources = list(self.trees)
+        rebuild_all_pairs = self.all_pairs is not None
+        self.trees = {}
+        self.all_pairs = None
+        self.version = self.graph.version
+        for start in sources:
+            self.track_source(start)
+        if rebuild_all_pairs:
+            self.track_all_pairs()
+    
+    def _check_weights(self):
+        if any(weight < 0 for _, _, weight in self.graph.edges):
+            raise ValueError("Динамические кратчайшие пути не поддерживают отрицательные веса")
+    
+    def _register_new_stations(self):
+        for distances, parent, _ in self.trees.values():
+            for station in self.graph.stations:
+                if station not in distances:
+                    distances[station] = float('inf')
+                    parent[station] = None
+        
+        if self.all_pairs is not None:
+            n = len(self.graph.station_index)
+            for row in self.all_pairs:
+                row.extend([float('inf')] * (n - len(row)))
+            for i in range(len(self.all_pairs), n):
+                row = [float('inf')] * n
+                row[i] = 0.0
+                self.all_pairs.append(row)
+    
+    def _propagate(self, start: str, heap: List[Tuple[float, str]]):
+        distances, parent, children = self.trees[start]
+        heapq.heapify(heap)
+        
+        adjacency = self.graph.graph
+        while heap:
+            current_dist, current = heapq.heappop(heap)
+            if current_dist > distances[current]:
+                continue
+            
+            for neighbor, weight in adjacency[current]:
+                new_dist = current_dist + weight
+                if new_dist < distances[neighbor]:
+                    distances[neighbor] = new_dist
+                    if parent[neighbor] is not None:
+                        children[parent[neighbor]].discard(neighbor)
+                    parent[neighbor] = current
+                    children[current].add(neighbor)
+                    heapq.heappush(heap, (new_dist, neighbor))
+    
+    def _on_decrease(self, u: str, v: str, weight: float):
+        for start, (distances, parent, children) in self.trees.items():
+            new_dist = distances[u] + weight
+            if new_dist < distances[v]:
+                distances[v] = new_dist
+                if parent[v] is not None:
+                    children[parent[v]].discard(v)
+                parent[v] = u
+                children[u].add(v)
+                self._propagate(start, [(new_dist, v)])
+        
+        if self.all_pairs is not None:
+            dist = self.all_pairs
+            iu = self.graph.station_index[u]
+            iv = self.graph.station_index[v]
+            row_v = dist[iv]
+            reachable_from_v = [(j, d) for j, d in enumerate(row_v) if d != float('inf')]
+            for row in dist:
+                to_u = row[iu]
+                if to_u == float('inf'):
+                    continue
+                base = to_u + weight
+                for j, d in reachable_from_v:
+                    if base + d < row[j]:
+                        row[j] = base + d
+    
+    def _on_increase(self, u: str, v: str, old_weight: float):
+        for start, (distances, parent, children) in self.trees.items():
+            if parent[v] != u:
+                continue
+            
+            affected = []
+            stack = [v]
+            while stack:
+                current = stack.pop()
+                affected.append(current)
+                stack.extend(children.pop(current, ()))
+            
+            affected_set = set(affected)
+            children[u].discard(v)
+            for station in affected:
+                distances[station] = float('inf')
+                parent[station] = None
+            
+            heap = []
+            for station in affected:
+                for predecessor, weight in self.graph.reverse_graph[station]:
+                    if predecessor in affected_set:
+                        continue
+                    new_dist = distances[predecessor] + weight
+                    if new_dist < distances[station]:
+                        distances[station] = new_dist
+                        parent[station] = predecessor
+                if parent[station] is not None:
+                    children[parent[station]].add(station)
+                    heap.append((distances[station], station))
+            
+            self._propagate(start, heap)
+        
+        if self.all_pairs is not None:
+            iu = self.graph.station_index[u]
+            iv = self.graph.station_index[v]
+            for i, row in enumerate(self.all_pairs):
+                if row[iu] == float('inf') or row[iu] + old_weight > row[iv] + 1e-9 * max(1.0, abs(row[iv])):
+                    continue
+                distances = self.graph.shortest_path_Dijkstra(self.graph.index_station[i])
+                for station, d in distances.items():
+                    row[self.graph.station_index[station]] = d
+
+
+class NetworkOptimizer:
+    
+    def __init__(self, graph: TransportGraph):
+        self.graph = graph
+    
+    def minimum_spanning_tree_Kruskal(self) -> Tuple[List[Tuple[str, str, float]], float]:
+        engine = self.graph._engine()
+        if engine is not None:
+            mst_edges, total_weight = engine.kruskal()
+            return self.graph._indices_to_edges(mst_edges), total_weight
+        
+        station_index = self.graph.station_index
+        sources = array('i', (station_index[f] for f, _, _ in self.graph.edges))
+        targets = array('i', (station_index[t] for _, t, _ in self.graph.edges))
+        weights = array('d', (w for _, _, w in self.graph.edges))
+        
+        mst_edges, total_weight = _kruskal_indexed(len(station_index), sources, targets, weights,
+                                                   _weight_order(weights))
+        return self.graph._indices_to_edges(mst_edges), total_weight
+    
+    def minimum_spanning_forest_Boruvka(self) -> Tuple[Dict[int, Tuple[List[Tuple[str, str, float]], float]],
+                                                       Dict[str, int]]:
+        _require_numpy()
+        
+        n = len(self.graph.station_index)
+        station_index = self.graph.station_index
+        edges = self.graph.edges
+        
+        sources = np.fromiter((station_index[f] for f, _, _ in edges), dtype=np.int64, count=len(edges))
+        targets = np.fromiter((station_index[t] for _, t, _ in edges), dtype=np.int64, count=len(edges))
+        weights = np.fromiter((w for _, _, w in edges), dtype=np.float64, count=len(edges))
+        
+        order = np.lexsort((np.arange(len(edges)), weights))
+        edge_rank = np.empty(len(edges), dtype=np.int64)
+        edge_rank[order] = np.arange(len(edges))
+        
+        component = np.arange(n, dtype=np.int64)
+        alive = np.flatnonzero(sources != targets)
+        selected = []
+        no_edge = np.iinfo(np.int64).max
+        
+        while alive.size:
+            cu = component[sources[alive]]
+            cv = component[targets[alive]]
+            crossing = cu != cv
+            alive, cu, cv = alive[crossing], cu[crossing], cv[crossing]
+            if not alive.size:
+                break
+            
+            ranks = edge_rank[alive]
+            cheapest = np.full(n, no_edge, dtype=np.int64)
+            np.minimum.at(cheapest, cu, ranks)
+            np.minimum.at(cheapest, cv, ranks)
+            
+            has_edge = np.flatnonzero(cheapest != no_edge)
+            chosen = np.unique(cheapest[has_edge])
+            selected.append(order[chosen])
+            
+            chosen_edges = order[cheapest[has_edge]]
+            ends_u = component[sources[chosen_edges]]
+            ends_v = component[targets[chosen_edges]]
+            parent = np.arange(n, dtype=np.int64)
+            parent[has_edge] = np.where(ends_u == has_edge, ends_v, ends_u)
+            
+            mutual = parent[parent] == np.arange(n)
+            keep_root = mutual & (np.arange(n) < parent)
+            parent[keep_root] = np.flatnonzero(keep_root)
+            
+            while True:
+                grand = parent[parent]
+                if np.array_equal(grand, parent):
+                    break
+                parent = grand
+            
+            component = parent[component]
+        
+        _, component_id = np.unique(component, return_inverse=True)
+        forest: Dict[int, Tuple[List[Tuple[str, str, float]], float]] = {
+            int(cid): ([], 0.0) for cid in np.unique(component_id)
+        }
+        
+        for edge in (np.sort(np.concatenate(selected)) if selected else []):
+            from_station, to_station, weight = edges[edge]
+            cid = int(component_id[station_index[from_station]])
+            tree_edges, total_weight = forest[cid]
+            tree_edges.append((from_station, to_station, weight))
+            forest[cid] = (tree_edges, total_weight + weight)
+        
+        membership = {self.graph.index_station[i]: int(component_id[i]) for i in range(n)}
+        return forest, membership
+    
+    def minimum_spanning_tree_Prim(self, start: Optional[str] = None,
+                                   indexed_heap: bool = False) -> Tuple[List[Tuple[str, str, float]], float]:
+        if not self.graph.stations:
+            return [], 0.0
+        
+        if start is None:
+            start = next(iter(self.graph.stations))
+        
+        if start not in self.graph.stations:
+            return [], 0.0
+        
+        engine = self.graph._engine()
+        if engine is not None:
+            if indexed_heap:
+                mst_edges, total_weight = engine.prim_indexed_heap(self.graph.station_index[start])
+            else:
+                mst_edges, total_weight = engine.prim(self.graph.station_index[start])
+            return self.graph._indices_to_edges(mst_edges), total_weight
+        
+        if indexed_heap:
+            return self._prim_indexed_heap(start)
+        
+        visited = {start}
+        mst_edges = []
+        total_weight = 0.0
+        edges_heap = []
+        
+        for neighbor, weight in self.graph.graph[start]:
+            heapq.heappush(edges_heap, (weight, start, neighbor))
+        
+        adjacency = self.graph.graph
+        while len(visited) < len(self.graph.stations) and edges_heap:
+            weight, from_station, to_station = heapq.heappop(edges_heap)
+            
+            if to_station in visited:
+                continue
+            
+            visited.add(to_station)
+            mst_edges.append((from_station, to_station, weight))
+            total_weight += weight
+            
+            for neighbor, edge_weight in adjacency[to_station]:
+                if neighbor not in visited:
+                    heapq.heappush(edges_heap, (edge_weight, to_station, neighbor))
+        
+        return mst_edges, total_weight
+    
+    def _prim_indexed_heap(self, start: str) -> Tuple[List[Tuple[str, str, float]], float]:
+        station_index, index_station = self.graph.station_index, self.graph.index_station
+        heap = IndexedHeap(len(station_index))
+        best_from = [-1] * len(station_index)
+        start_idx = station_index[start]
+        heap.push_or_decrease(start_idx, 0.0)
+        mst_edges = []
+        total_weight = 0.0
+        
+        adjacency = self.graph.graph
+        while heap:
+            weight, current = heap.pop()
+            current_name = index_station[current]
+            if current != start_idx:
+                mst_edges.append((index_station[best_from[current]], current_name, weight))
+                total_weight += weight
+            
+            for neighbor, edge_weight in adjacency[current_name]:
+                neighbor_idx = station_index[neighbor]
+                if heap.position[neighbor_idx] != -2 and heap.push_or_decrease(neighbor_idx, edge_weight):
+                    best_from[neighbor_idx] = current
+        
+        return mst_edges, total_weight
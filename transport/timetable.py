@@ -0,0 +1,111 @@
+from bisect import bisect_left
+from typing import Dict, List, Tuple, Optional, Hashable
+import heapq
+
+from .network import TransportGraph
+
+
+class TimetableRouter:
+    
+    def __init__(self, graph: Optional[TransportGraph] = None, transfer_time: float = 0.0):
+        self.graph = graph
+        self.transfer_time = transfer_time
+        self.connections: List[Tuple[float, float, str, str, Optional[Hashable]]] = []
+        self.departures: List[float] = []
+        self._sorted = True
+    
+    def add_connection(self, from_station: str, to_station: str, departure: float, arrival: float,
+                       trip: Optional[Hashable] = None):
+        if arrival < departure:
+            raise ValueError("Время прибытия не может быть раньше времени отправления")
+        
+        self.connections.append((departure, arrival, from_station, to_station, trip))
+        self._sorted = False
+    
+    def add_trip(self, trip: Hashable, stops: List[Tuple[str, float, float]]):
+        for (from_station, _, departure), (to_station, arrival, _) in zip(stops, stops[1:]):
+            self.add_connection(from_station, to_station, departure, arrival, trip)
+    
+    def _ensure_sorted(self):
+        if not self._sorted:
+            self.connections.sort(key=lambda c: (c[0], c[1]))
+            self.departures = [c[0] for c in self.connections]
+            self._sorted = True
+    
+    def _scan(self, start: str, target: Optional[str], departure_time: float
+              ) -> Tuple[Dict[str, float], Dict[str, Tuple[int, int]], Dict[str, Tuple[str, float]]]:
+        self._ensure_sorted()
+        
+        arrival = {start: departure_time}
+        ride: Dict[str, Tuple[int, int]] = {}
+        walk: Dict[str, Tuple[str, float]] = {}
+        boarded: Dict[Hashable, int] = {}
+        footpaths = self.graph.graph if self.graph is not None else {}
+        inf = float('inf')
+        
+        def relax_footpaths(station: str, time: float):
+            heap = [(time, station)]
+            while heap:
+                current_time, current = heapq.heappop(heap)
+                if current_time > arrival[current]:
+                    continue
+                for neighbor, duration in footpaths.get(current, []):
+                    if current_time + duration < arrival.get(neighbor, inf):
+                        arrival[neighbor] = current_time + duration
+                        walk[neighbor] = (current, duration)
+                        ride.pop(neighbor, None)
+                        heapq.heappush(heap, (current_time + duration, neighbor))
+        
+        relax_footpaths(start, departure_time)
+        
+        for index in range(bisect_left(self.departures, departure_time), len(self.connections)):
+            departure, arrive, from_station, to_station, trip = self.connections[index]
+            
+            if target is not None and departure >= arrival.get(target, inf):
+                break
+            
+            if trip is None or trip not in boarded:
+                ready = arrival.get(from_station, inf)
+                if from_station != start:
+                    ready += self.transfer_time
+                if ready > departure:
+                    continue
+                if trip is not None:
+                    boarded[trip] = index
+            
+            if arrive < arrival.get(to_station, inf):
+                arrival[to_station] = arrive
+                ride[to_station] = (boarded[trip] if trip is not None else index, index)
+                walk.pop(to_station, None)
+                relax_footpaths(to_station, arrive)
+        
+        return arrival, ride, walk
+    
+    def earliest_arrival(self, start: str, target: str, departure_time: float) -> float:
+        arrival, _, _ = self._scan(start, target, departure_time)
+        return arrival.get(target, float('inf'))
+    
+    def earliest_arrivals(self, start: str, departure_time: float) -> Dict[str, float]:
+        arrival, _, _ = self._scan(start, None, departure_time)
+        return arrival
+    
+    def journey(self, start: str, target: str, departure_time: float
+                ) -> List[Tuple[str, str, float, float, Optional[Hashable]]]:
+        arrival, ride, walk = self._scan(start, target, departure_time)
+        if target not in arrival:
+            return []
+        
+        legs = []
+        station = target
+        while station != start:
+            if station in ride:
+                board, alight = ride[station]
+                departure, _, from_station, _, trip = self.connections[board]
+                legs.append((from_station, station, departure, self.connections[alight][1], trip))
+            else:
+                from_station, duration = walk[station]
+                legs.append((from_station, station, arrival[station] - duration, arrival[station], None))
+            station = from_station
+        
+        legs.reverse()
+        return legs